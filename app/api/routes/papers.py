@@ -7,6 +7,7 @@ TODO: 실제 구현 시
 - 외부 논문 검색 API 연동 (arXiv, Semantic Scholar 등)
 """
 
+import logging
 import uuid
 from datetime import datetime
 
@@ -27,6 +28,8 @@ from app.schemas.paper import (
 from app.schemas.user import UserResponse
 from app.services import paper_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/papers", tags=["papers"])
 
 
@@ -178,7 +181,7 @@ async def upload_pdf(
         )
         
     except Exception as e:
-        print(f"[PDF Upload Error] DB 저장 실패: {e}")
+        logger.exception("[PDF Upload Error] DB 저장 실패: %s", e)
         # Storage에 업로드는 성공했지만 DB 저장 실패 시에도 응답 반환
         # (나중에 수동으로 정리 가능)
         raise HTTPException(
@@ -261,7 +264,7 @@ async def search_by_title(
     except CrudConfigError:
         return ApiResponse.fail("DB_NOT_CONFIGURED", "DB 설정이 필요합니다.")
     except Exception as e:
-        print(f"[Search Error] 검색 중 오류 발생: {e}")
+        logger.exception("[Search Error] 검색 중 오류 발생: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"논문 검색 중 오류가 발생했습니다: {str(e)}",
@@ -54,11 +54,26 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_ANON_KEY: str = ""
     SUPABASE_SERVICE_ROLE_KEY: str = ""
+    # PDF 공개 URL prefix (예: https://<proj>.supabase.co/storage/v1/object/public/papers/)
+    # 비워두면 SUPABASE_URL로부터 계산
+    SUPABASE_STORAGE_PUBLIC_BASE: str = ""
+
+    @property
+    def supabase_storage_public_base(self) -> str:
+        """papers 버킷 공개 URL prefix (항상 '/'로 끝남)"""
+        base = self.SUPABASE_STORAGE_PUBLIC_BASE or (
+            f"{self.SUPABASE_URL.rstrip('/')}/storage/v1/object/public/papers/"
+        )
+        return base if base.endswith("/") else f"{base}/"
 
     # 파일 업로드 설정
     MAX_UPLOAD_SIZE_MB: int = 25
     STORAGE_PATH: str = "./storage"
 
+    # GROBID 서버 설정
+    GROBID_URL: str = "http://localhost:8070"
+    GROBID_CONCURRENCY: int = 4  # 동시에 GROBID로 보내는 최대 요청 수
+
     # 커리큘럼 생성 API (외부 서비스)
     CURRICULUM_GENERATION_API_URL: str = "http://curr.ptmt.site"
     CURRICULUM_GENERATION_API_TOKEN: str = Field(default="", env="CURRICULUM_GENERATION_API_TOKEN")
@@ -0,0 +1,40 @@
+"""Shared HTTP Client - 외부 서비스 호출용 httpx.AsyncClient 재사용
+
+요청마다 AsyncClient를 새로 만들면 매번 TCP/TLS 연결을 다시 맺어야 하므로,
+이벤트 루프별로 하나의 클라이언트를 캐싱하여 keep-alive 연결을 재사용합니다.
+타임아웃/리다이렉트 등 호출별 옵션은 각 요청에서 지정합니다.
+"""
+
+import asyncio
+import weakref
+
+import httpx
+
+_DEFAULT_TIMEOUT = httpx.Timeout(30.0)
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32)
+
+_clients_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 AsyncClient를 반환 (없으면 생성)
+
+    테스트 러너처럼 루프가 여러 개인 환경에서 다른 루프의 연결을
+    재사용하지 않도록 이벤트 루프별로 캐싱합니다.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients_by_loop.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT, limits=_LIMITS)
+        _clients_by_loop[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """현재 이벤트 루프의 공유 AsyncClient를 닫습니다 (애플리케이션 종료 시)."""
+    loop = asyncio.get_running_loop()
+    client = _clients_by_loop.pop(loop, None)
+    if client is not None:
+        await client.aclose()
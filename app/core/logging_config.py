@@ -0,0 +1,53 @@
+"""Logging Configuration - 애플리케이션 로거 설정
+
+`app.*` 로거의 레코드를 QueueHandler로 큐에 넣고, QueueListener가
+백그라운드 스레드에서 포맷팅/출력을 처리하여 요청 처리 루프가
+stdout 쓰기에 막히지 않도록 합니다.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """`app` 로거에 QueueHandler를 연결하고 QueueListener를 시작합니다.
+
+    여러 번 호출해도 핸들러가 중복 등록되지 않습니다.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(logging.DEBUG if settings.DEBUG else logging.INFO)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """QueueListener를 중지하고 남은 로그를 모두 출력합니다."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    app_logger = logging.getLogger("app")
+    for handler in list(app_logger.handlers):
+        if isinstance(handler, QueueHandler):
+            app_logger.removeHandler(handler)
+    app_logger.propagate = True
+    _listener = None
@@ -235,9 +235,17 @@ async def find_curriculum_by_paper_and_options(
 
 
 async def list_curriculums(
-    *, status: Optional[str] = None, page: int = 1, limit: int = 20
+    *,
+    status: Optional[str] = None,
+    page: int = 1,
+    limit: int = 20,
+    filters: Optional[dict[str, Any]] = None,
 ) -> tuple[list[dict[str, Any]], int]:
-    """Return (items, total)."""
+    """Return (items, total).
+
+    ``filters`` maps column names to values matched with equality, e.g.
+    ``filters={"id": curriculum_id}``.
+    """
 
     if page < 1:
         raise ValueError("page must be >= 1")
@@ -254,6 +262,8 @@ async def list_curriculums(
         )
         if status:
             q = q.eq("status", status)
+        for column, value in (filters or {}).items():
+            q = q.eq(column, value)
         resp = await q.range(offset, offset + limit - 1).execute()
     except APIError as e:
         raise translate_postgrest_error(e, default_message="Failed to list curriculums") from e
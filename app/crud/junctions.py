@@ -8,15 +8,97 @@ DDL junction tables:
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
 from typing import Any
 
 from postgrest.exceptions import APIError
-from postgrest.types import CountMethod
+from postgrest.types import CountMethod, ReturnMethod
 
 from .errors import NotFoundError
 from .supabase_client import get_supabase_client, translate_postgrest_error
 
 
+# Link columns of each junction table (also the composite primary key, see
+# docs/RDB_SCHEMA.md; older databases may still need that migration)
+_LINK_COLUMNS: dict[str, tuple[str, str]] = {
+    "user_papers": ("user_id", "paper_id"),
+    "user_curriculums": ("user_id", "curriculum_id"),
+    "curriculum_papers": ("curriculum_id", "paper_id"),
+}
+
+
+async def _insert_links(
+    table: str, pairs: list[tuple[str, str]], *, ignore_duplicates: bool
+) -> None:
+    columns = _LINK_COLUMNS[table]
+    rows = [dict(zip(columns, pair, strict=True)) for pair in pairs]
+    client = await get_supabase_client()
+    try:
+        if ignore_duplicates:
+            # ON CONFLICT needs a matching primary key/unique index, otherwise 42P10
+            request = client.table(table).upsert(
+                rows,
+                on_conflict=",".join(columns),
+                ignore_duplicates=True,
+                returning=ReturnMethod.minimal,
+            )
+        else:
+            request = client.table(table).insert(rows, returning=ReturnMethod.minimal)
+        await request.execute()
+    except APIError as e:
+        raise translate_postgrest_error(e, default_message=f"Failed to bulk-link {table}") from e
+
+
+async def add_links(
+    *,
+    user_papers: Iterable[tuple[str, str]] = (),
+    user_curriculums: Iterable[tuple[str, str]] = (),
+    curriculum_papers: Iterable[tuple[str, str]] = (),
+    ignore_duplicates: bool = False,
+) -> None:
+    """Bulk-create junction links with one array insert per non-empty table.
+
+    Pairs follow each table's column order, e.g. ``user_papers=[(user_id, paper_id)]``,
+    and the per-table requests run concurrently.
+
+    With ``ignore_duplicates=True`` links that already exist are skipped
+    (``ON CONFLICT DO NOTHING``). That requires the composite primary keys from
+    docs/RDB_SCHEMA.md on the junction tables; without them PostgREST rejects
+    the request, so only pass it where the migration is known to be applied.
+    """
+
+    batches = {
+        "user_papers": list(user_papers),
+        "user_curriculums": list(user_curriculums),
+        "curriculum_papers": list(curriculum_papers),
+    }
+    await asyncio.gather(
+        *(
+            _insert_links(table, pairs, ignore_duplicates=ignore_duplicates)
+            for table, pairs in batches.items()
+            if pairs
+        )
+    )
+
+
+async def _link_exists(table: str, filters: dict[str, str], *, error_message: str) -> bool:
+    """Return whether a junction row matching all filters exists.
+
+    Uses a HEAD request with an exact count so no row payload is transferred.
+    """
+
+    client = await get_supabase_client()
+    query = client.table(table).select("*", count=CountMethod.exact, head=True)
+    for column, value in filters.items():
+        query = query.eq(column, value)
+    try:
+        resp = await query.execute()
+    except APIError as e:
+        raise translate_postgrest_error(e, default_message=error_message) from e
+    return bool(resp.count)
+
+
 # -----------------------
 # user_papers
 # -----------------------
@@ -61,6 +143,14 @@ async def ensure_user_paper(*, user_id: str, paper_id: str) -> dict[str, Any]:
     return insert_resp.data[0]
 
 
+async def user_paper_exists(*, user_id: str, paper_id: str) -> bool:
+    return await _link_exists(
+        "user_papers",
+        {"user_id": user_id, "paper_id": paper_id},
+        error_message="Failed to check user_papers link",
+    )
+
+
 async def remove_user_paper(*, user_id: str, paper_id: str) -> None:
     client = await get_supabase_client()
     # Ensure NotFound semantics even if delete returns minimal body.
@@ -152,6 +242,14 @@ async def add_user_curriculum(*, user_id: str, curriculum_id: str) -> dict[str,
     return resp.data[0]
 
 
+async def user_curriculum_exists(*, user_id: str, curriculum_id: str) -> bool:
+    return await _link_exists(
+        "user_curriculums",
+        {"user_id": user_id, "curriculum_id": curriculum_id},
+        error_message="Failed to check user_curriculums link",
+    )
+
+
 async def remove_user_curriculum(*, user_id: str, curriculum_id: str) -> None:
     client = await get_supabase_client()
     try:
@@ -244,6 +342,14 @@ async def add_curriculum_paper(*, curriculum_id: str, paper_id: str) -> dict[str
     return resp.data[0]
 
 
+async def curriculum_paper_exists(*, curriculum_id: str, paper_id: str) -> bool:
+    return await _link_exists(
+        "curriculum_papers",
+        {"curriculum_id": curriculum_id, "paper_id": paper_id},
+        error_message="Failed to check curriculum_papers link",
+    )
+
+
 async def remove_curriculum_paper(*, curriculum_id: str, paper_id: str) -> None:
     client = await get_supabase_client()
     try:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Optional
 
 from postgrest.exceptions import APIError
@@ -20,7 +21,8 @@ async def create_paper(
     language: str = "english",
     source_url: Optional[str] = None,
     pdf_storage_path: Optional[str] = None,
-    extracted_text: Optional[str] = None,
+    extracted_text: Optional[dict[str, Any]] = None,
+    content_sha256: Optional[str] = None,
 ) -> dict[str, Any]:
     client = await get_supabase_client()
     payload: dict[str, Any] = {
@@ -31,6 +33,7 @@ async def create_paper(
         "source_url": source_url,
         "pdf_storage_path": pdf_storage_path,
         "extracted_text": extracted_text,
+        "content_sha256": content_sha256,
     }
     try:
         resp = await client.table("papers").insert(payload).execute()
@@ -42,6 +45,53 @@ async def create_paper(
     return resp.data[0]
 
 
+async def create_paper_and_curriculum_atomic(
+    *,
+    user_id: str,
+    title: str,
+    curriculum_title: str,
+    curriculum_status: str = "paper_attached",
+    authors: Optional[list[str]] = None,
+    abstract: Optional[str] = None,
+    language: str = "english",
+    source_url: Optional[str] = None,
+    pdf_storage_path: Optional[str] = None,
+    extracted_text: Optional[Mapping[str, Any]] = None,
+    content_sha256: Optional[str] = None,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Create paper + empty curriculum and link both to the user in one transaction.
+
+    Calls the `create_paper_with_curriculum` SQL function (see docs/RDB_SCHEMA.md),
+    so papers, curriculums, user_papers, curriculum_papers and user_curriculums
+    rows are written in a single round-trip. Returns (paper, curriculum).
+    """
+    client = await get_supabase_client()
+    params: dict[str, Any] = {
+        "p_user_id": user_id,
+        "p_title": title,
+        "p_authors": authors,
+        "p_abstract": abstract,
+        "p_language": language,
+        "p_source_url": source_url,
+        "p_pdf_storage_path": pdf_storage_path,
+        "p_extracted_text": extracted_text,
+        "p_content_sha256": content_sha256,
+        "p_curriculum_title": curriculum_title,
+        "p_curriculum_status": curriculum_status,
+    }
+    try:
+        resp = await client.rpc("create_paper_with_curriculum", params).execute()
+    except APIError as e:
+        raise translate_postgrest_error(
+            e, default_message="Failed to create paper with curriculum"
+        ) from e
+
+    data = resp.data
+    if not isinstance(data, dict) or not data.get("paper") or not data.get("curriculum"):
+        raise RuntimeError("Supabase rpc returned no data for create_paper_with_curriculum")
+    return data["paper"], data["curriculum"]
+
+
 async def get_paper(paper_id: str) -> dict[str, Any]:
     client = await get_supabase_client()
     try:
@@ -80,6 +130,25 @@ async def get_paper_by_title(title: str) -> Optional[dict[str, Any]]:
     return resp.data[0]
 
 
+async def get_paper_by_sha256(content_sha256: str) -> Optional[dict[str, Any]]:
+    """Return the paper whose PDF bytes hash to content_sha256, or None if not found."""
+    client = await get_supabase_client()
+    try:
+        req = (
+            client.table("papers")
+            .select("*")
+            .eq("content_sha256", content_sha256)
+            .limit(1)
+        )
+        resp = await req.execute()
+    except APIError as e:
+        raise translate_postgrest_error(e, default_message="Failed to fetch paper by sha256") from e
+
+    if not resp.data:
+        return None
+    return resp.data[0]
+
+
 async def get_papers_by_user(
     *,
     user_id: Optional[str] = None,
@@ -157,8 +226,14 @@ async def get_paper_by_curr(
     return await get_papers_by_curriculum(curriculum_id=curriculum_id, page=page, limit=limit)
 
 
-async def list_papers(*, page: int = 1, limit: int = 20) -> tuple[list[dict[str, Any]], int]:
-    """Return (items, total)."""
+async def list_papers(
+    *, page: int = 1, limit: int = 20, filters: Optional[dict[str, Any]] = None
+) -> tuple[list[dict[str, Any]], int]:
+    """Return (items, total).
+
+    ``filters`` maps column names to values matched with equality, e.g.
+    ``filters={"id": paper_id}``.
+    """
 
     if page < 1:
         raise ValueError("page must be >= 1")
@@ -168,13 +243,10 @@ async def list_papers(*, page: int = 1, limit: int = 20) -> tuple[list[dict[str,
     client = await get_supabase_client()
     offset = (page - 1) * limit
     try:
-        resp = (
-            client.table("papers")
-            .select("*", count=CountMethod.exact)
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
-        )
-        resp = await resp.execute()
+        q = client.table("papers").select("*", count=CountMethod.exact)
+        for column, value in (filters or {}).items():
+            q = q.eq(column, value)
+        resp = await q.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
     except APIError as e:
         raise translate_postgrest_error(e, default_message="Failed to list papers") from e
 
@@ -63,8 +63,20 @@ async def revoke_refresh_token(token_id: str, *, revoked_at: Optional[datetime]
 
 
 async def list_user_refresh_tokens(
-    user_id: str, *, page: int = 1, limit: int = 50
+    user_id: str,
+    *,
+    page: int = 1,
+    limit: int = 50,
+    columns: tuple[str, ...] = ("id", "revoked_at", "expires_at"),
+    filters: Optional[dict[str, Any]] = None,
 ) -> tuple[list[dict[str, Any]], int]:
+    """List a user's refresh tokens, newest first.
+
+    Only ``columns`` are selected (token hashes are not needed for listing);
+    pass ``("*",)`` for full rows. ``filters`` adds equality matches on top of
+    ``user_id``, e.g. ``filters={"id": token_id}``.
+    """
+
     if page < 1:
         raise ValueError("page must be >= 1")
     if limit < 1:
@@ -73,14 +85,14 @@ async def list_user_refresh_tokens(
     client = await get_supabase_client()
     offset = (page - 1) * limit
     try:
-        resp = (
+        q = (
             client.table("refresh_tokens")
-            .select("*", count=CountMethod.exact)
+            .select(",".join(columns), count=CountMethod.exact)
             .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .range(offset, offset + limit - 1)
         )
-        resp = await resp.execute()
+        for column, value in (filters or {}).items():
+            q = q.eq(column, value)
+        resp = await q.order("created_at", desc=True).range(offset, offset + limit - 1).execute()
     except APIError as e:
         raise translate_postgrest_error(e, default_message="Failed to list refresh tokens") from e
 
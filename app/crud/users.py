@@ -5,12 +5,16 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from cachetools import TTLCache
 from postgrest.exceptions import APIError
 
 from .errors import NotFoundError
 from . import junctions
 from .supabase_client import get_supabase_client, translate_postgrest_error
 
+# ensure_user_exists에서 존재가 확인된 user_id (TTL 동안 users 조회 생략)
+_existing_user_ids: TTLCache[str, bool] = TTLCache(maxsize=100_000, ttl=600)
+
 
 async def create_user(
     *,
@@ -132,6 +136,38 @@ async def get_user_by_curr(
     )
 
 
+async def get_user_with_curriculums(user_id: str) -> dict[str, Any]:
+    """Return the user row with its linked curriculums under ``"curriculums"``.
+
+    Uses PostgREST resource embedding (users -> user_curriculums -> curriculums)
+    so the user and its curriculums come back in a single request.
+    """
+
+    client = await get_supabase_client()
+    try:
+        req = (
+            client.table("users")
+            .select("*, user_curriculums(curriculums(*))")
+            .eq("id", user_id)
+            .maybe_single()
+        )
+        resp = await req.execute()
+    except APIError as e:
+        raise translate_postgrest_error(e, default_message="Failed to fetch user with curriculums") from e
+
+    data = resp.data if resp is not None else None
+    if not isinstance(data, dict):
+        raise NotFoundError("User not found")
+    user: dict[str, Any] = dict(data)
+    links = user.pop("user_curriculums", None)
+    user["curriculums"] = [
+        link["curriculums"]
+        for link in (links if isinstance(links, list) else [])
+        if isinstance(link, dict) and isinstance(link.get("curriculums"), dict)
+    ]
+    return user
+
+
 async def update_user(user_id: str, **fields: Any) -> dict[str, Any]:
     client = await get_supabase_client()
     if not fields:
@@ -150,6 +186,7 @@ async def update_user(user_id: str, **fields: Any) -> dict[str, Any]:
 
 
 async def delete_user(user_id: str) -> None:
+    _existing_user_ids.pop(user_id, None)
     # Ensure proper NotFound semantics even if delete returns minimal response body.
     _ = await get_user(user_id)
     client = await get_supabase_client()
@@ -164,6 +201,8 @@ async def delete_user(user_id: str) -> None:
 async def ensure_user_exists(user_id: str, email: str, name: str, avatar_url: str | None, role: str) -> None:
     """users 테이블에 사용자가 있는지 확인하고, 없으면 에러 발생
     
+    존재가 확인된 user_id는 TTL 캐시에 기록되어 이후 호출에서 DB 조회를 생략합니다.
+    
     Args:
         user_id: 사용자 ID
         email: 이메일
@@ -174,6 +213,8 @@ async def ensure_user_exists(user_id: str, email: str, name: str, avatar_url: st
     Raises:
         ValueError: users 테이블에 사용자가 없는 경우
     """
+    if user_id in _existing_user_ids:
+        return
     try:
         await get_user(user_id)
     except NotFoundError:
@@ -182,4 +223,4 @@ async def ensure_user_exists(user_id: str, email: str, name: str, avatar_url: st
             f"User {user_id} not found in users table. "
             "Please ensure the user is properly registered through signup."
         )
-
+    _existing_user_ids[user_id] = True
@@ -12,8 +12,11 @@ from fastapi.responses import JSONResponse
 
 from app.api.router import api_router
 from app.core.config import settings
+from app.core.http_client import close_http_client
+from app.core.logging_config import setup_logging, shutdown_logging
 from app.crud.supabase_client import get_supabase_auth_client, get_supabase_client
 from app.schemas.common import ApiResponse
+from app.services.paper_service import drain_background_tasks
 
 
 @asynccontextmanager
@@ -26,6 +29,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     - 백그라운드 워커 시작
     """
     # Startup
+    setup_logging()
     print(f"🚀 Starting {settings.APP_NAME} API Server...")
     print(f"📍 Environment: {settings.APP_ENV}")
     print(f"🔗 CORS Origins: {settings.cors_origins_list}")
@@ -60,6 +64,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # TODO: DB 연결 해제
     # await database.disconnect()
 
+    # 백그라운드 키워드 추출이 공유 HTTP 클라이언트를 쓰므로 먼저 정리
+    await drain_background_tasks()
+    await close_http_client()
+    shutdown_logging()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
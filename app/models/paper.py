@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from sqlmodel import Field, SQLModel, Column
+from sqlmodel import Field, SQLModel, Column, JSON
 from sqlalchemy import ARRAY, String
 
 
@@ -29,7 +29,8 @@ class Paper(SQLModel, table=True):
     source_url: Optional[str] = Field(default=None)
     doi: Optional[str] = Field(default=None, max_length=100)
     pdf_storage_path: Optional[str] = Field(default=None)
-    extracted_text: Optional[str] = Field(default=None)
+    extracted_text: Optional[dict] = Field(default=None, sa_column=Column(JSON))  # GROBID 파싱 결과 { title, author, abstract, body }
+    content_sha256: Optional[str] = Field(default=None, max_length=64, unique=True)
     keywords: Optional[List[str]] = Field(default=None, sa_column=Column(ARRAY(String)))
     summary: Optional[str] = Field(default=None)
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import Any
 
 import httpx
@@ -13,6 +14,8 @@ import httpx
 from app.core.config import settings
 from app.crud import curriculums, papers
 
+logger = logging.getLogger(__name__)
+
 CURR_GENERATE_PATH = "/api/curr/curr/generate"
 
 
@@ -161,8 +164,9 @@ async def start_generation(
         "Content-Type": "application/json",
     }
 
-    print(headers)
-    print(body)
+    # 헤더에는 API 토큰이 있으므로 남기지 않고, 큰 본문은 DEBUG에서만 출력
+    logger.info("[Curriculum Generation] API 호출: %s (slot=%s)", url, assigned_key_slot)
+    logger.debug("[Curriculum Generation] 요청 본문: %s", body)
     async with httpx.AsyncClient(timeout=60.0) as client:
         resp = await client.post(url, json=body, headers=headers)
         resp.raise_for_status()
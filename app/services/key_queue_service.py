@@ -7,13 +7,13 @@ and cooldown handling.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import math
 import time
-import uuid
 from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Optional
+from typing import Callable, Deque, Optional
 
 from app.core.config import settings
 
@@ -28,7 +28,7 @@ logger = logging.getLogger(__name__)
 class QueueTicket:
     """Represents one waiting job in FIFO queue."""
 
-    ticket_id: str
+    ticket_id: int
     task_type: str
     task_id: Optional[str]
 
@@ -54,6 +54,7 @@ class KeyQueueService:
         cooldown_seconds: int = 30,
         cooldown_by_task: Optional[dict[str, int]] = None,
         max_busy_seconds: int = 600,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         if total_keys < 1:
             raise ValueError("total_keys must be >= 1")
@@ -81,9 +82,12 @@ class KeyQueueService:
         self._curriculum_leases: dict[str, int] = {}
         self._condition = asyncio.Condition()
         self._round_robin_cursor = -1
+        self._ticket_ids = itertools.count()
+        # Injectable monotonic clock so tests can advance time without sleeping.
+        self._clock = clock
 
     def _now(self) -> float:
-        return time.monotonic()
+        return self._clock()
 
     def _get_slot_by_number(self, slot_number: int) -> Optional[KeySlot]:
         if slot_number < 1 or slot_number > self._total_keys:
@@ -154,7 +158,7 @@ class KeyQueueService:
             return cooldown_timeout
         return min(cooldown_timeout, busy_timeout)
 
-    def _remove_ticket_locked(self, ticket_id: str) -> bool:
+    def _remove_ticket_locked(self, ticket_id: int) -> bool:
         for index, ticket in enumerate(self._wait_queue):
             if ticket.ticket_id == ticket_id:
                 del self._wait_queue[index]
@@ -237,7 +241,7 @@ class KeyQueueService:
         """
 
         ticket = QueueTicket(
-            ticket_id=uuid.uuid4().hex,
+            ticket_id=next(self._ticket_ids),
             task_type=task_type,
             task_id=task_id,
         )
@@ -321,6 +325,11 @@ class KeyQueueService:
             self._condition.notify_all()
             return changed
 
+    def waiting_jobs_count(self) -> int:
+        """Return number of queued jobs without building a full snapshot."""
+
+        return len(self._wait_queue)
+
     async def get_snapshot(
         self,
         *,
@@ -2,53 +2,94 @@
 
 from __future__ import annotations
 
-import json
-import re
-import uuid
-from typing import Any
+import asyncio
+import hashlib
+import logging
+from collections.abc import Mapping
+from typing import Any, AsyncIterator
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 
 from app import crud
 from app.core.config import settings
-from app.crud.supabase_client import get_supabase_client
+from app.core.http_client import get_http_client
+from app.crud.errors import ConflictError
+from app.crud.supabase_client import require_supabase_config
 from app.services import pdf_service
 from app.services.key_queue_service import key_queue_service
 from app.crud.users import ensure_user_exists
 from app.utils.arxiv_paper_search import search_arxiv_first_pdf
+from app.utils.grobid_xml_to_json import ParsedPaper
+
+logger = logging.getLogger(__name__)
+
+# 키워드 추출 API 엔드포인트/헤더 (설정값은 런타임에 바뀌지 않으므로 import 시 한 번만 계산)
+_KEYWORD_API_BASE = (settings.KEYWORD_EXTRACTION_API_URL or "").rstrip("/")
+_KEYWORD_API_TOKEN = (settings.KEYWORD_EXTRACTION_API_TOKEN or "").strip()
+_KEYWORD_API_URL: str | None = (
+    f"{_KEYWORD_API_BASE}/api/curr/keywords/extract" if _KEYWORD_API_BASE else None
+)
+_KEYWORD_HEADERS: dict[str, str] | None = (
+    {
+        "Authorization": f"Bearer {_KEYWORD_API_TOKEN}",
+        "Content-Type": "application/json",
+    }
+    if _KEYWORD_API_TOKEN
+    else None
+)
+
+
+def _public_pdf_url(storage_path: str) -> str:
+    """Storage 경로의 공개 URL (버킷 공개 URL 규칙으로 직접 계산, Storage 호출 없음)"""
+    return f"{settings.supabase_storage_public_base}{storage_path}"
 
 
 async def upload_pdf_to_storage(
-    *, contents: bytes, user_id: str, filename: str
+    *,
+    contents: bytes | AsyncIterator[bytes],
+    user_id: str,
+    filename: str,
+    content_sha256: str,
 ) -> tuple[str, str]:
     """PDF를 Supabase Storage에 업로드
     
+    Storage REST API에 PDF를 multipart가 아닌 원본 바이트 본문으로 전송합니다.
+    bytes는 복사 없이 그대로, AsyncIterator는 청크 단위로 스트리밍됩니다.
+    
     Args:
-        contents: PDF 파일 내용
+        contents: PDF 파일 내용 (bytes 또는 바이트 청크 AsyncIterator)
         user_id: 사용자 ID
         filename: 파일명
+        content_sha256: PDF 내용의 SHA-256 (Storage 객체 이름으로 사용)
         
     Returns:
         (storage_path, pdf_url) 튜플
     """
-    client = await get_supabase_client()
+    url, key = require_supabase_config()
     
-    # Storage 경로 생성: {user_id}/{uuid}.pdf
-    file_id = uuid.uuid4()
-    storage_path = f"{user_id}/{file_id}.pdf"
+    # Storage 경로 생성: {user_id}/{sha256}.pdf — 같은 내용이면 같은 경로이므로 upsert로 멱등 업로드
+    storage_path = f"{user_id}/{content_sha256}.pdf"
     
-    await client.storage.from_("papers").upload(
-        path=storage_path,
-        file=contents,
-        file_options={"content-type": "application/pdf"}
+    resp = await get_http_client().post(
+        f"{url.rstrip('/')}/storage/v1/object/papers/{storage_path}",
+        content=contents,
+        headers={
+            "Authorization": f"Bearer {key}",
+            "apikey": key,
+            "Content-Type": "application/pdf",
+            "x-upsert": "true",
+        },
+        timeout=60.0,
     )
+    resp.raise_for_status()
     
     # 업로드된 파일의 공개 URL 생성
-    pdf_url = await client.storage.from_("papers").get_public_url(storage_path)
+    pdf_url = _public_pdf_url(storage_path)
     
-    print(f"[PDF Upload] 파일 업로드 완료: {storage_path}")
-    print(f"[PDF Upload] 공개 URL: {pdf_url}")
+    logger.info("[PDF Upload] 파일 업로드 완료: %s", storage_path)
+    logger.debug("[PDF Upload] 공개 URL: %s", pdf_url)
     
     return storage_path, pdf_url
 
@@ -82,21 +123,16 @@ async def create_curriculum_for_paper(
         node_count=0,
         estimated_hours=0.0,
     )
-    print(f"[Paper Service] Curriculum 생성 완료: {curriculum['id']}")
+    curriculum_id = str(curriculum["id"])
+    logger.info("[Paper Service] Curriculum 생성 완료: %s", curriculum_id)
     
-    # Curriculum-Paper 연결
-    await crud.junctions.add_curriculum_paper(
-        curriculum_id=str(curriculum["id"]),
-        paper_id=paper_id,
+    # Curriculum-Paper / User-Curriculum 연결 (테이블별 요청을 동시에 수행)
+    # 방금 만든 curriculum이라 중복이 없으므로 ON CONFLICT 없이 일반 insert로 연결
+    await crud.junctions.add_links(
+        curriculum_papers=[(curriculum_id, paper_id)],
+        user_curriculums=[(user_id, curriculum_id)],
     )
-    print(f"[Paper Service] Curriculum-Paper 연결 완료")
-    
-    # User-Curriculum 연결
-    await crud.junctions.add_user_curriculum(
-        user_id=user_id,
-        curriculum_id=str(curriculum["id"]),
-    )
-    print(f"[Paper Service] User-Curriculum 연결 완료")
+    logger.debug("[Paper Service] Curriculum-Paper, User-Curriculum 연결 완료")
     
     return curriculum
 
@@ -110,11 +146,13 @@ async def create_paper_with_curriculum(
     language: str = "english",
     source_url: str | None = None,
     pdf_storage_path: str | None = None,
-    extracted_text: str | None = None,
+    extracted_text: ParsedPaper | None = None,
+    content_sha256: str | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any]]:
     """Paper와 빈 Curriculum을 생성하고 모든 관계를 연결
     
     범용 함수: PDF, 링크, 검색 등 모든 방식에서 사용 가능
+    Paper/Curriculum/junction 생성을 DB 함수 한 번 호출(단일 트랜잭션)로 처리합니다.
     
     Args:
         user_id: 사용자 ID
@@ -124,40 +162,174 @@ async def create_paper_with_curriculum(
         language: 언어
         source_url: 원본 URL (선택)
         pdf_storage_path: Storage 경로 (선택)
-        extracted_text: 추출된 본문 텍스트 (선택)
+        extracted_text: GROBID 파싱 결과 딕셔너리 (선택, JSONB로 저장)
+        content_sha256: PDF 내용의 SHA-256 (선택)
         
     Returns:
         (paper, curriculum) 튜플
     """
-    # Paper 생성
-    paper = await crud.papers.create_paper(
+    paper, curriculum = await crud.papers.create_paper_and_curriculum_atomic(
+        user_id=user_id,
         title=title,
+        curriculum_title=f"{title} 학습 커리큘럼",
+        curriculum_status="paper_attached",  # Paper만 첨부된 상태
         authors=authors or ["Unknown Author"],
         abstract=abstract or "AI가 논문을 분석하여 핵심 개념을 추출했습니다.",
         language=language,
         source_url=source_url,
         pdf_storage_path=pdf_storage_path,
         extracted_text=extracted_text,
+        content_sha256=content_sha256,
     )
-    print(f"[Paper Service] Paper 생성 완료: {paper['id']}")
-    
-    # User-Paper 연결 (junction table)
-    await crud.junctions.add_user_paper(
-        user_id=user_id,
-        paper_id=str(paper["id"]),
-    )
-    print(f"[Paper Service] User-Paper 연결 완료")
-    
-    # Curriculum 생성 및 연결
-    curriculum = await create_curriculum_for_paper(
-        user_id=user_id,
-        paper_id=str(paper["id"]),
-        paper_title=title,
+    logger.info(
+        "[Paper Service] Paper/Curriculum 생성 및 연결 완료: paper=%s curriculum=%s",
+        paper["id"],
+        curriculum["id"],
     )
     
     return paper, curriculum
 
 
+# 이보다 큰 PDF는 워커 스레드에서 해시 (hashlib은 큰 버퍼 처리 중 GIL을 해제)
+_HASH_IN_THREAD_MIN_BYTES = 1024 * 1024
+
+
+async def _sha256_hexdigest(contents: bytes) -> str:
+    if len(contents) < _HASH_IN_THREAD_MIN_BYTES:
+        return hashlib.sha256(contents).hexdigest()
+    return await asyncio.to_thread(lambda: hashlib.sha256(contents).hexdigest())
+
+
+def _keyword_count(paper: dict[str, Any] | None) -> int:
+    keywords_list = paper.get("keywords") if paper else None
+    return len(keywords_list) if isinstance(keywords_list, list) else 0
+
+
+async def _reuse_cached_paper(
+    *, existing: dict[str, Any], user_id: str, paper_title: str
+) -> tuple[dict[str, Any], dict[str, Any], str]:
+    """기존 paper를 재사용: Storage 업로드 없이 사용자·새 Curriculum만 연결"""
+    paper_id = str(existing["id"])
+    # User-Paper 연결과 Curriculum 생성은 서로 독립적이므로 동시에 수행
+    curriculum: dict[str, Any]
+    _, curriculum = await asyncio.gather(
+        crud.junctions.ensure_user_paper(user_id=user_id, paper_id=paper_id),
+        create_curriculum_for_paper(
+            user_id=user_id,
+            paper_id=paper_id,
+            paper_title=paper_title,
+        ),
+    )
+    storage_path = existing.get("pdf_storage_path")
+    pdf_url = _public_pdf_url(storage_path) if storage_path else ""
+    logger.info("[PDF Processing] 기존 paper 조회 완료: %s", paper_id)
+    return existing, curriculum, pdf_url
+
+
+async def _refill_extracted_text(*, paper: dict[str, Any], contents: bytes) -> dict[str, Any]:
+    """본문 추출 결과가 없는 paper에 대해 GROBID 추출을 다시 시도하고 같은 row를 갱신
+
+    이전 업로드에서 GROBID가 실패하면 paper가 extracted_text 없이(제목은 파일명) 저장되는데,
+    같은 내용의 업로드는 해시로 이 row를 재사용하므로 여기서 다시 추출하지 않으면
+    영영 채워지지 않습니다. 다시 실패하면 기존 row를 그대로 반환합니다.
+    """
+    try:
+        metadata, extracted_text = await pdf_service.extract_all(contents)
+    except Exception as e:
+        logger.warning("[PDF Processing] GROBID 본문 재추출 실패: %s", e)
+        return paper
+
+    fields: dict[str, Any] = {"extracted_text": extracted_text}
+    fields.update({key: metadata[key] for key in ("title", "authors", "abstract") if metadata.get(key)})
+    updated = await crud.papers.update_paper(paper_id=str(paper["id"]), **fields)
+    logger.info("[PDF Processing] 본문 재추출 후 paper 갱신: %s", paper["id"])
+    return updated
+
+
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _run_keyword_extraction(
+    *,
+    paper_id: str,
+    paper_title: str,
+    paper_authors: list[str],
+    paper_abstract: str,
+    extracted_text: str | Mapping[str, Any],
+    queue_task_id: str | None,
+) -> None:
+    """키워드 추출 API 호출 후 paper의 keywords/summary 업데이트 (백그라운드 태스크)"""
+    api_url = _KEYWORD_API_URL
+    if api_url is None:
+        return
+    logger.debug("[AI Keyword Extraction] AI 키워드 추출 시작")
+    assigned_key_slot: int | None = None
+    try:
+        # 타입으로 분기: GROBID 결과 dict를 그대로 사용 (JSONB 이전에 저장된 JSON 문자열도 처리)
+        if isinstance(extracted_text, Mapping):
+            paper_body = extracted_text.get("body", [])
+        elif isinstance(extracted_text, str) and extracted_text[:1] == "{":
+            paper_body = orjson.loads(extracted_text).get("body", [])
+        else:
+            paper_body = [{"subtitle": "Full Text", "text": str(extracted_text)}]
+        paper_content = {
+            "title": paper_title,
+            "author": ", ".join(paper_authors) if paper_authors else "",
+            "abstract": paper_abstract,
+            "body": paper_body,
+        }
+        assigned_key_slot = await key_queue_service.acquire_slot(
+            task_type="keyword_extraction",
+            task_id=queue_task_id or paper_id,
+        )
+        body = {
+            "paper_id": paper_id,
+            "paper_content": paper_content,
+            "assigned_key_slot": assigned_key_slot,
+        }
+        logger.info(
+            "[AI Keyword Extraction] API 호출: %s (slot=%s)",
+            api_url,
+            assigned_key_slot,
+        )
+        resp = await get_http_client().post(
+            api_url,
+            json=body,
+            headers=_KEYWORD_HEADERS,
+            timeout=120.0,
+        )
+        resp.raise_for_status()
+        result = resp.json()
+        keywords = result.get("keywords", [])
+        summary = result.get("summary")
+        logger.info("[AI Keyword Extraction] 추출된 키워드: %s", keywords)
+        await crud.papers.update_paper(
+            paper_id=paper_id,
+            keywords=keywords,
+            summary=summary,
+        )
+    except Exception as e:
+        logger.warning("[AI Keyword Extraction] 키워드 추출 실패: %s", e)
+    finally:
+        if assigned_key_slot is not None:
+            await key_queue_service.release_slot(assigned_key_slot)
+
+
+async def drain_background_tasks(timeout: float = 30.0) -> None:
+    """진행 중인 키워드 추출 태스크를 기다리고, timeout 안에 끝나지 않으면 취소 (애플리케이션 종료 시)
+
+    공유 HTTP 클라이언트를 닫기 전에 호출해야 진행 중인 요청이 닫힌 클라이언트로 실패하지 않습니다.
+    """
+    if not _background_tasks:
+        return
+    _, pending = await asyncio.wait(list(_background_tasks), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning("[AI Keyword Extraction] 종료 시 미완료 태스크 %d개 취소", len(pending))
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
 async def process_pdf_upload(
     *,
     contents: bytes,
@@ -168,6 +340,7 @@ async def process_pdf_upload(
     user_avatar_url: str | None,
     user_role: str,
     queue_task_id: str | None = None,
+    content_sha256: str | None = None,
 ) -> tuple[dict[str, Any], dict[str, Any], str]:
     """PDF 업로드 전체 프로세스
     
@@ -180,32 +353,14 @@ async def process_pdf_upload(
         user_avatar_url: 프로필 이미지 URL
         user_role: 사용자 역할
         queue_task_id: 클라이언트가 전달한 대기열 추적 ID (선택)
+        content_sha256: 다운로드 중 계산된 PDF 내용의 SHA-256 (없으면 여기서 계산)
         
     Returns:
         (paper, curriculum, pdf_url) 튜플
     """
-    # 1. PDF 텍스트 및 메타데이터 추출 (GROBID) — 제목 확보 후 캐시 조회용
-    print(f"[PDF Processing] PDF 처리 시작: {filename}")
-    print(f"[PDF Processing] 파일 크기: {len(contents)} bytes")
-    try:
-        print(f"[PDF Processing] 메타데이터 추출 중...")
-        metadata = await pdf_service.extract_metadata(contents)
-        print(f"[PDF Processing] 제목: {metadata['title']}")
-        print(f"[PDF Processing] 저자: {len(metadata['authors'])}명")
-        print(f"[PDF Processing] 본문 텍스트 추출 중...")
-        extracted_text = await pdf_service.extract_text(contents)
-        print(f"[PDF Processing] 추출된 텍스트 길이: {len(extracted_text)} characters")
-    except Exception as e:
-        print(f"[PDF Processing] GROBID 처리 실패: {e}")
-        extracted_text = ""
-        metadata = {
-            "title": filename.replace(".pdf", ""),
-            "authors": ["Unknown Author"],
-            "abstract": "",
-            "keywords": [],
-        }
+    logger.info("[PDF Processing] PDF 처리 시작: %s (%d bytes)", filename, len(contents))
 
-    # 2. 사용자 확인
+    # 1. 사용자 확인
     await ensure_user_exists(
         user_id=user_id,
         email=user_email,
@@ -214,127 +369,163 @@ async def process_pdf_upload(
         role=user_role,
     )
 
+    # 2. 내용 해시로 기존 paper 조회 — 바이트가 같은 PDF는 GROBID/Storage 업로드 생략
+    if content_sha256 is None:
+        content_sha256 = await _sha256_hexdigest(contents)
+    same_content = await crud.papers.get_paper_by_sha256(content_sha256)
+    if same_content is not None and _keyword_count(same_content) == 5:
+        logger.info("[PDF Processing] 해시 캐시 히트: %s", content_sha256)
+        return await _reuse_cached_paper(
+            existing=same_content,
+            user_id=user_id,
+            paper_title=same_content.get("title") or filename.replace(".pdf", ""),
+        )
+
+    if same_content is not None and not same_content.get("extracted_text"):
+        same_content = await _refill_extracted_text(paper=same_content, contents=contents)
+
+    # 3. PDF 메타데이터 추출 (GROBID 헤더 모델, 앞 페이지만) — 제목 확보 후 캐시 조회용
+    #    같은 내용의 paper가 있으면(키워드 미완성) 저장된 추출 결과를 재사용
+    if same_content is not None:
+        logger.info(
+            "[PDF Processing] 해시 일치 paper 재사용 (키워드 %d개): %s",
+            _keyword_count(same_content),
+            same_content["id"],
+        )
+        # JSONB 이전에 저장된 행은 JSON 문자열일 수 있음
+        extracted_text: Mapping[str, Any] | str | None = same_content.get("extracted_text")
+        metadata: dict[str, Any] = {
+            "title": same_content.get("title"),
+            "authors": same_content.get("authors"),
+            "abstract": same_content.get("abstract"),
+            "keywords": [],
+        }
+    else:
+        extracted_text = None  # 본문 전체 추출은 캐시 미스일 때만 수행
+        try:
+            metadata = await pdf_service.extract_header_only(contents)
+            logger.info(
+                "[PDF Processing] 제목: %s, 저자: %d명",
+                metadata["title"],
+                len(metadata["authors"]),
+            )
+        except Exception as e:
+            logger.warning("[PDF Processing] GROBID 헤더 처리 실패: %s", e)
+            metadata = {
+                "title": filename.replace(".pdf", ""),
+                "authors": ["Unknown Author"],
+                "abstract": "",
+                "keywords": [],
+            }
+
     paper_title = metadata.get("title") or filename.replace(".pdf", "")
     paper_authors = metadata.get("authors") or ["Unknown Author"]
     paper_abstract = metadata.get("abstract") or "초록을 추출할 수 없습니다."
 
-    # 3. 제목으로 기존 paper 조회 (캐시) — 키워드 5개일 때만 캐시 히트
-    existing = await crud.papers.get_paper_by_title(paper_title)
-    keywords_list = existing.get("keywords") if existing else None
-    keyword_count = len(keywords_list) if isinstance(keywords_list, list) else 0
-    if existing is not None and keyword_count == 5:
-        print(f"[PDF Processing] 캐시 히트: 업로드 생략, 기존 paper 재사용, 키워드 추출 생략 (키워드 {keyword_count}개)")
-        # 캐시 히트: 업로드 생략, 기존 paper 재사용, 키워드 추출 생략
-        await crud.junctions.ensure_user_paper(user_id=user_id, paper_id=str(existing["id"]))
-        curriculum = await create_curriculum_for_paper(
+    if same_content is not None:
+        # 4-a. 해시 일치 paper 재사용: 업로드 생략, 키워드 추출만 다시 수행
+        paper, curriculum, pdf_url = await _reuse_cached_paper(
+            existing=same_content, user_id=user_id, paper_title=paper_title
+        )
+    else:
+        # 4-b. 제목으로 기존 paper 조회 (캐시) — 키워드 5개일 때만 캐시 히트
+        existing = await crud.papers.get_paper_by_title(paper_title)
+        keyword_count = _keyword_count(existing)
+        if existing is not None and keyword_count == 5:
+            logger.info(
+                "[PDF Processing] 캐시 히트: 업로드 생략, 기존 paper 재사용, 키워드 추출 생략 (키워드 %d개)",
+                keyword_count,
+            )
+            return await _reuse_cached_paper(
+                existing=existing, user_id=user_id, paper_title=paper_title
+            )
+
+        # 4-c. 캐시 미스: 본문 전체 추출, Storage 업로드 후 새 paper 생성
+        logger.info("[PDF Processing] 캐시 미스: 본문 추출 및 Storage 업로드 후 새 paper 생성")
+        parsed_text: ParsedPaper | None = None
+        try:
+            full_metadata, parsed_text = await pdf_service.extract_all(contents)
+            extracted_text = parsed_text
+            paper_authors = full_metadata.get("authors") or paper_authors
+            paper_abstract = full_metadata.get("abstract") or paper_abstract
+            logger.info("[PDF Processing] 추출된 본문 섹션: %d개", len(parsed_text["body"]))
+        except Exception as e:
+            logger.warning("[PDF Processing] GROBID 본문 처리 실패: %s", e)
+        storage_path, pdf_url = await upload_pdf_to_storage(
+            contents=contents,
             user_id=user_id,
-            paper_id=str(existing["id"]),
-            paper_title=paper_title,
+            filename=filename,
+            content_sha256=content_sha256,
         )
-        storage_path = existing.get("pdf_storage_path")
-        if storage_path:
-            client = await get_supabase_client()
-            pdf_url = await client.storage.from_("papers").get_public_url(storage_path)
-        else:
-            pdf_url = ""
-        print(f"[PDF Processing] 기존 paper 조회 완료: {existing['id']}")
-        return existing, curriculum, pdf_url
+        try:
+            paper, curriculum = await create_paper_with_curriculum(
+                user_id=user_id,
+                title=paper_title,
+                authors=paper_authors,
+                abstract=paper_abstract,
+                language="english",
+                source_url=None,
+                pdf_storage_path=storage_path,
+                extracted_text=parsed_text,
+                content_sha256=content_sha256,
+            )
+        except ConflictError:
+            # 같은 PDF가 동시에 업로드되어 다른 요청이 먼저 paper를 만든 경우 (content_sha256 unique 위반)
+            # 그 row를 재사용하고, 키워드 추출은 먼저 만든 요청에 맡김
+            winner = await crud.papers.get_paper_by_sha256(content_sha256)
+            if winner is None:
+                raise
+            logger.info("[PDF Processing] 동시 업로드 충돌: 먼저 생성된 paper 재사용: %s", winner["id"])
+            return await _reuse_cached_paper(
+                existing=winner,
+                user_id=user_id,
+                paper_title=winner.get("title") or paper_title,
+            )
+    # 5. 키워드 추출은 백그라운드에서 수행하고 바로 응답 (완료되면 paper의 keywords/summary가 갱신됨)
+    if _KEYWORD_API_URL and _KEYWORD_HEADERS and extracted_text:
+        task = asyncio.create_task(
+            _run_keyword_extraction(
+                paper_id=str(paper["id"]),
+                paper_title=paper_title,
+                paper_authors=paper_authors,
+                paper_abstract=paper_abstract,
+                extracted_text=extracted_text,
+                queue_task_id=queue_task_id,
+            )
+        )
+        # 실행 중인 태스크가 GC되지 않도록 참조 유지
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+    else:
+        logger.info("[AI Keyword Extraction] API 설정이 없거나 추출된 텍스트가 없어 건너뜁니다.")
 
-    # 4. 캐시 미스: Storage 업로드 후 새 paper 생성
-    print(f"[PDF Processing] 캐시 미스: Storage 업로드 후 새 paper 생성")
-    storage_path, pdf_url = await upload_pdf_to_storage(
-        contents=contents,
-        user_id=user_id,
-        filename=filename,
-    )
-    paper, curriculum = await create_paper_with_curriculum(
-        user_id=user_id,
-        title=paper_title,
-        authors=paper_authors,
-        abstract=paper_abstract,
-        language="english",
-        source_url=None,
-        pdf_storage_path=storage_path,
-        extracted_text=extracted_text,
-    )
-    paper_id = str(paper["id"])
+    return paper, curriculum, pdf_url
 
-    # 5. 키워드 추출 API 호출 및 paper 업데이트
-    print(f"[AI Keyword Extraction] AI 키워드 추출 시작")
-    try:
-        api_url = (settings.KEYWORD_EXTRACTION_API_URL or "").rstrip("/")
-        token = (settings.KEYWORD_EXTRACTION_API_TOKEN or "").strip()
-        if api_url and token and extracted_text:
-            keyword_api_url = f"{api_url}/api/curr/keywords/extract"
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-            assigned_key_slot: int | None = None
-            paper_body = []
-            try:
-                if isinstance(extracted_text, str):
-                    parsed_text = json.loads(extracted_text)
-                    paper_body = parsed_text.get("body", [])
-                elif isinstance(extracted_text, dict):
-                    paper_body = extracted_text.get("body", [])
-                else:
-                    paper_body = [{"subtitle": "Full Text", "text": str(extracted_text)}]
-            except (json.JSONDecodeError, AttributeError):
-                paper_body = [{"subtitle": "Full Text", "text": extracted_text}]
-            paper_content = {
-                "title": paper_title,
-                "author": ", ".join(paper_authors) if paper_authors else "",
-                "abstract": paper_abstract,
-                "body": paper_body,
-            }
-            try:
-                assigned_key_slot = await key_queue_service.acquire_slot(
-                    task_type="keyword_extraction",
-                    task_id=queue_task_id or paper_id,
-                )
-                body = {
-                    "paper_id": paper_id,
-                    "paper_content": paper_content,
-                    "assigned_key_slot": assigned_key_slot,
-                }
-                print(
-                    f"[AI Keyword Extraction] API 호출: {keyword_api_url} (slot={assigned_key_slot})"
-                )
-                async with httpx.AsyncClient(timeout=120.0) as client:
-                    resp = await client.post(
-                        keyword_api_url,
-                        json=body,
-                        headers=headers,
-                    )
-                    resp.raise_for_status()
-                    result = resp.json()
-                    keywords = result.get("keywords", [])
-                    summary = result.get("summary")
-                    print(f"[AI Keyword Extraction] 추출된 키워드: {keywords}")
-                    await crud.papers.update_paper(
-                        paper_id=paper_id,
-                        keywords=keywords,
-                        summary=summary,
-                    )
-                    paper["keywords"] = keywords
-            finally:
-                if assigned_key_slot is not None:
-                    await key_queue_service.release_slot(assigned_key_slot)
-        else:
-            print(f"[AI Keyword Extraction] API 설정이 없거나 추출된 텍스트가 없어 건너뜁니다.")
-    except Exception as e:
-        print(f"[AI Keyword Extraction] 키워드 추출 실패: {e}")
 
-    return paper, curriculum, pdf_url
+_ARXIV_PDF_PREFIXES = ("http://arxiv.org/pdf/", "https://arxiv.org/pdf/")
+
 
+def _parse_arxiv_pdf(url: str) -> str | None:
+    """arXiv PDF URL이면 논문 ID를 반환, 아니면 None.
+
+    https://arxiv.org/pdf/1706.03762 or https://arxiv.org/pdf/1706.03762.pdf -> "1706.03762"
+    """
+    prefix = next((p for p in _ARXIV_PDF_PREFIXES if url[: len(p)].lower() == p), None)
+    if prefix is None:
+        return None
+    arxiv_id = url[len(prefix):]
+    if arxiv_id[-4:].lower() == ".pdf":
+        arxiv_id = arxiv_id[:-4]
+    if not arxiv_id or not arxiv_id.replace(".", "").isalnum() or not arxiv_id.isascii():
+        return None
+    return arxiv_id
 
-# arXiv PDF URL: https://arxiv.org/pdf/1706.03762 or https://arxiv.org/pdf/1706.03762.pdf
-_ARXIV_PDF_RE = re.compile(r"^https?://arxiv\.org/pdf/([a-zA-Z0-9.]+)(?:\.pdf)?$", re.IGNORECASE)
 
+async def _download_pdf_from_url(url: str) -> tuple[bytes, str, str]:
+    """Download PDF from URL and return (contents, filename, content_sha256).
 
-async def _download_pdf_from_url(url: str) -> tuple[bytes, str]:
-    """Download PDF from URL and return (contents, filename).
+    The SHA-256 digest is computed chunk by chunk while streaming, so the
+    caller does not need to hash the whole buffer again.
 
     Accepts:
         - https://arxiv.org/pdf/<id>
@@ -348,51 +539,54 @@ async def _download_pdf_from_url(url: str) -> tuple[bytes, str]:
     path = (parsed.path or "").rstrip("/")
     path_lower = path.lower()
 
-    # Optional: allow only known PDF patterns before requesting (save a request for obvious non-PDF)
-    # We still validate Content-Type after GET.
-
+    # 본문은 스트리밍으로 받으므로, PDF가 아니면 헤더만 보고 본문 전송 전에 거절합니다.
     timeout = 30.0
     max_bytes = settings.max_upload_size_bytes
 
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout) as client:
-        try:
-            resp = await client.get(url)
+    client = get_http_client()
+    try:
+        async with client.stream("GET", url, follow_redirects=True, timeout=timeout) as resp:
             resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise ValueError(f"PDF 다운로드 실패: HTTP {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise ValueError(f"PDF 다운로드 실패: {e!s}") from e
-
-        content_type = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
-        is_pdf_content = content_type == "application/pdf"
-        is_pdf_path = path_lower.endswith(".pdf")
-
-        # arXiv PDF link
-        arxiv_match = _ARXIV_PDF_RE.match(url)
-        if arxiv_match:
-            # arXiv often returns html for some endpoints; check content-type
-            if not is_pdf_content:
-                raise ValueError("해당 arXiv 링크에서 PDF를 받을 수 없습니다. URL이 PDF 직접 링크인지 확인해 주세요.")
-            filename = f"{arxiv_match.group(1)}.pdf"
-        elif is_pdf_content or is_pdf_path:
-            if not is_pdf_content and is_pdf_path:
-                # Path says .pdf but server might return something else
-                if content_type and "application/pdf" not in content_type:
-                    raise ValueError("PDF 링크가 아닙니다. (Content-Type이 application/pdf가 아님)")
-            filename = path.split("/")[-1] if path_lower.endswith(".pdf") else "downloaded.pdf"
-            if not filename or not filename.lower().endswith(".pdf"):
-                filename = "downloaded.pdf"
-        else:
-            raise ValueError("PDF 링크가 아닙니다. (Content-Type이 application/pdf가 아니고, 경로도 .pdf로 끝나지 않음)")
-
-        # Read body with size limit
-        body = b""
-        async for chunk in resp.aiter_bytes(chunk_size=65536):
-            body += chunk
-            if len(body) > max_bytes:
-                raise ValueError(f"파일 크기가 {settings.MAX_UPLOAD_SIZE_MB}MB를 초과합니다.")
 
-    return body, filename
+            content_type = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
+            is_pdf_content = content_type == "application/pdf"
+            is_pdf_path = path_lower.endswith(".pdf")
+
+            # arXiv PDF link
+            arxiv_id = _parse_arxiv_pdf(url)
+            if arxiv_id:
+                # arXiv often returns html for some endpoints; check content-type
+                if not is_pdf_content:
+                    raise ValueError("해당 arXiv 링크에서 PDF를 받을 수 없습니다. URL이 PDF 직접 링크인지 확인해 주세요.")
+                filename = f"{arxiv_id}.pdf"
+            elif is_pdf_content or is_pdf_path:
+                if not is_pdf_content and is_pdf_path:
+                    # Path says .pdf but server might return something else
+                    if content_type and "application/pdf" not in content_type:
+                        raise ValueError("PDF 링크가 아닙니다. (Content-Type이 application/pdf가 아님)")
+                filename = path.split("/")[-1] if path_lower.endswith(".pdf") else "downloaded.pdf"
+                if not filename or not filename.lower().endswith(".pdf"):
+                    filename = "downloaded.pdf"
+            else:
+                raise ValueError("PDF 링크가 아닙니다. (Content-Type이 application/pdf가 아니고, 경로도 .pdf로 끝나지 않음)")
+
+            # Read body with size limit
+            buf = bytearray()
+            total_len = 0
+            digest = hashlib.sha256()
+            async for chunk in resp.aiter_bytes(chunk_size=65536):
+                # 버퍼에 넣기 전에 한도를 확인하여 거절할 청크는 복사하지 않음
+                total_len += len(chunk)
+                if total_len > max_bytes:
+                    raise ValueError(f"파일 크기가 {settings.MAX_UPLOAD_SIZE_MB}MB를 초과합니다.")
+                digest.update(chunk)
+                buf.extend(chunk)
+    except httpx.HTTPStatusError as e:
+        raise ValueError(f"PDF 다운로드 실패: HTTP {e.response.status_code}") from e
+    except httpx.RequestError as e:
+        raise ValueError(f"PDF 다운로드 실패: {e!s}") from e
+
+    return bytes(buf), filename, digest.hexdigest()
 
 
 async def submit_link(
@@ -410,10 +604,11 @@ async def submit_link(
     Returns:
         (paper, curriculum, pdf_url) same as process_pdf_upload.
     """
-    contents, filename = await _download_pdf_from_url(url)
+    contents, filename, content_sha256 = await _download_pdf_from_url(url)
     return await process_pdf_upload(
         contents=contents,
         filename=filename,
+        content_sha256=content_sha256,
         user_id=user_id,
         user_email=user_email,
         user_name=user_name,
@@ -427,6 +622,7 @@ async def _process_pdf_and_attach_source(
     *,
     contents: bytes,
     filename: str,
+    content_sha256: str | None,
     source_url: str | None,
     user_id: str,
     user_email: str,
@@ -439,6 +635,7 @@ async def _process_pdf_and_attach_source(
     paper, curriculum, pdf_url = await process_pdf_upload(
         contents=contents,
         filename=filename,
+        content_sha256=content_sha256,
         user_id=user_id,
         user_email=user_email,
         user_name=user_name,
@@ -466,10 +663,11 @@ async def search_by_title(
     arxiv_result = await search_arxiv_first_pdf(query)
     if arxiv_result and arxiv_result.get("pdf_url"):
         try:
-            contents, filename = await _download_pdf_from_url(arxiv_result["pdf_url"])
+            contents, filename, content_sha256 = await _download_pdf_from_url(arxiv_result["pdf_url"])
             return await _process_pdf_and_attach_source(
                 contents=contents,
                 filename=filename,
+                content_sha256=content_sha256,
                 source_url=arxiv_result.get("source_url"),
                 user_id=user_id,
                 user_email=user_email,
@@ -481,6 +679,6 @@ async def search_by_title(
         except ValueError:
             raise
         except Exception as e:
-            print(f"[Search] arXiv PDF 다운로드/처리 실패: {e}")
+            logger.warning("[Search] arXiv PDF 다운로드/처리 실패: %s", e)
 
     raise ValueError("검색 결과가 없습니다.")
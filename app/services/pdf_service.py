@@ -1,96 +1,115 @@
 """PDF Service - PDF 파일 처리
 
-GROBID 공식 클라이언트를 사용하여 PDF에서 텍스트와 메타데이터를 추출합니다.
+GROBID REST API를 호출하여 PDF에서 텍스트와 메타데이터를 추출합니다.
 """
 
 import asyncio
-import json
-import tempfile
-from pathlib import Path
+from typing import Any
 
-from grobid_client.grobid_client import GrobidClient
+from app.core.config import settings
+from app.core.http_client import get_http_client
+from app.utils.grobid_xml_to_json import ParsedPaper, parse_grobid_xml_string
 
-from app.utils.grobid_xml_to_json import parse_grobid_xml
+# GROBID 전문 처리는 수십 초가 걸릴 수 있으므로 여유 있게 설정 (grobid-client 기본값과 동일)
+_GROBID_TIMEOUT_SECONDS = 180.0
 
+# GROBID는 서버 내부에서 처리 수가 제한되므로, 그 이상 동시에 보내면 대기열만 길어짐
+_GROBID_SEMAPHORE = asyncio.Semaphore(max(1, settings.GROBID_CONCURRENCY))
 
-def _process_pdf_with_grobid(pdf_bytes: bytes) -> dict:
-    """GROBID로 PDF 처리 (동기 함수)
+
+async def _process_pdf_with_grobid(
+    pdf_bytes: bytes,
+    service: str = "processFulltextDocument",
+    start: int = -1,
+    end: int = -1,
+) -> ParsedPaper:
+    """GROBID REST API로 PDF 처리
+    
+    PDF 바이트를 그대로 multipart로 전송하고, 응답 TEI XML을 메모리에서 바로 파싱합니다.
+    (임시 PDF/XML 파일을 만들지 않습니다.)
     
     Args:
         pdf_bytes: PDF 파일 바이트
+        service: GROBID 서비스 이름 (processFulltextDocument / processHeaderDocument)
+        start: 처리 시작 페이지 (-1이면 처음부터)
+        end: 처리 마지막 페이지 (-1이면 끝까지)
         
     Returns:
         파싱된 논문 정보 딕셔너리
     """
-    # 1. 임시 파일 생성 (GrobidClient.process_pdf는 파일 경로를 요구)
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-        tmp_pdf.write(pdf_bytes)
-        tmp_pdf_path = tmp_pdf.name
+    data = {
+        "generateIDs": "0",
+        "consolidateHeader": "1",
+        "consolidateCitations": "0",
+        "includeRawCitations": "0",
+        "includeRawAffiliations": "0",
+        "teiCoordinates": "0",
+        "segmentSentences": "0",
+    }
+    if start > 0:
+        data["start"] = str(start)
+    if end > 0:
+        data["end"] = str(end)
     
-    # 2. 임시 출력 디렉토리
-    with tempfile.TemporaryDirectory() as tmp_output_dir:
-        try:
-            # 3. GrobidClient 생성
-            grobid_client = GrobidClient(check_server=False)
-            
-            # 4. process_pdf 호출 (동기 함수)
-            pdf_file, status, xml_text = grobid_client.process_pdf(
-                service="processFulltextDocument",
-                pdf_file=tmp_pdf_path,
-                generateIDs=False,
-                consolidate_header=True,
-                consolidate_citations=False,
-                include_raw_citations=False,
-                include_raw_affiliations=False,
-                tei_coordinates=False,
-                segment_sentences=False,
-                flavor=None,
-                start=-1,
-                end=-1
-            )
-            
-            # 5. 상태 확인
-            if status != 200:
-                raise ValueError(f"GROBID 처리 실패: status={status}, error={xml_text}")
-            
-            # 6. XML을 임시 파일로 저장 (parse_grobid_xml이 파일 경로를 요구)
-            tmp_xml_path = Path(tmp_output_dir) / "temp.tei.xml"
-            with open(tmp_xml_path, 'w', encoding='utf-8') as f:
-                f.write(xml_text)
-            
-            # 7. XML 파싱하여 JSON으로 변환
-            result = parse_grobid_xml(tmp_xml_path)
-            
-            return result
-            
-        finally:
-            # 8. 임시 PDF 파일 삭제
-            Path(tmp_pdf_path).unlink(missing_ok=True)
-
-
-async def extract_text(pdf_bytes: bytes) -> str:
-    """PDF에서 텍스트 추출
+    # 1. GROBID API 호출 (동시 요청 수 제한)
+    async with _GROBID_SEMAPHORE:
+        resp = await get_http_client().post(
+            f"{settings.GROBID_URL.rstrip('/')}/api/{service}",
+            files={"input": ("input.pdf", pdf_bytes, "application/pdf")},
+            data=data,
+            timeout=_GROBID_TIMEOUT_SECONDS,
+        )
     
-    GROBID 공식 클라이언트를 사용하여 PDF를 처리하고,
-    추출된 정보를 JSON string으로 반환합니다.
+    # 2. 상태 확인
+    if resp.status_code != 200:
+        raise ValueError(f"GROBID 처리 실패: status={resp.status_code}, error={resp.text}")
+    
+    # 3. XML 파싱하여 JSON으로 변환 (CPU 작업이므로 워커 스레드에서 실행)
+    return await asyncio.to_thread(parse_grobid_xml_string, resp.content)
+
+
+def _to_metadata(result: ParsedPaper) -> dict[str, Any]:
+    """GROBID 파싱 결과에서 메타데이터 딕셔너리를 만듭니다."""
+    return {
+        "title": result.get("title", ""),
+        "authors": result.get("author", []),
+        "abstract": result.get("abstract", ""),
+        "keywords": [],
+    }
+
+
+async def extract_all(pdf_bytes: bytes) -> tuple[dict[str, Any], ParsedPaper]:
+    """PDF를 GROBID로 한 번만 처리하여 메타데이터와 본문 텍스트를 함께 추출
     
     Args:
-        pdf_bytes: PDF 파일 바이트 (Supabase Storage에서 다운로드한 것)
+        pdf_bytes: PDF 파일 바이트
         
     Returns:
-        JSON 형식의 문자열: {"title": "...", "author": [...], "abstract": "...", "body": [...]}
+        (metadata, extracted_text) 튜플
+        - metadata: {"title": str, "authors": list[str], "abstract": str, "keywords": list}
+        - extracted_text: {"title": "...", "author": [...], "abstract": "...", "body": [...]} 딕셔너리
+          (papers.extracted_text JSONB 컬럼에 그대로 저장)
     """
-    # 동기 함수를 비동기로 실행 (블로킹 방지)
-    result = await asyncio.to_thread(_process_pdf_with_grobid, pdf_bytes)
+    result = await _process_pdf_with_grobid(pdf_bytes)
     
-    # JSON을 string으로 변환
-    json_string = json.dumps(result, ensure_ascii=False, indent=2)
+    return _to_metadata(result), result
+
+
+async def extract_text(pdf_bytes: bytes) -> ParsedPaper:
+    """PDF에서 텍스트 추출 (extract_all 래퍼)
     
-    return json_string
+    Args:
+        pdf_bytes: PDF 파일 바이트 (Supabase Storage에서 다운로드한 것)
+        
+    Returns:
+        파싱 결과 딕셔너리: {"title": "...", "author": [...], "abstract": "...", "body": [...]}
+    """
+    _, extracted_text = await extract_all(pdf_bytes)
+    return extracted_text
 
 
-async def extract_metadata(pdf_bytes: bytes) -> dict:
-    """PDF에서 논문 메타데이터 추출
+async def extract_metadata(pdf_bytes: bytes) -> dict[str, Any]:
+    """PDF에서 논문 메타데이터 추출 (extract_all 래퍼)
     
     Args:
         pdf_bytes: PDF 파일 바이트
@@ -98,27 +117,28 @@ async def extract_metadata(pdf_bytes: bytes) -> dict:
     Returns:
         메타데이터 딕셔너리: {"title": str, "authors": list[str], "abstract": str, "keywords": list}
     """
-    # 동기 함수를 비동기로 실행
-    result = await asyncio.to_thread(_process_pdf_with_grobid, pdf_bytes)
-    
-    return {
-        "title": result.get("title", ""),
-        "authors": result.get("author", []),
-        "abstract": result.get("abstract", ""),
-        "keywords": [],  # TODO: 키워드 추출 구현
-    }
+    metadata, _ = await extract_all(pdf_bytes)
+    return metadata
 
 
-async def extract_keywords(text: str) -> list:
-    """텍스트에서 핵심 키워드 추출
+async def extract_header_only(pdf_bytes: bytes, end_page: int = 3) -> dict[str, Any]:
+    """PDF 앞부분만 GROBID 헤더 모델로 처리하여 메타데이터 추출
+    
+    제목/저자/초록은 대부분 첫 페이지에 있으므로 `processHeaderDocument`에
+    1~end_page 페이지만 넘겨 본문 파싱 비용 없이 캐시 조회용 메타데이터를 얻습니다.
     
-    TODO: 실제 구현
-    - AI로 도메인 키워드 추출
-    - 중요도 점수 계산
-    - 연관 키워드 확장
+    Args:
+        pdf_bytes: PDF 파일 바이트
+        end_page: 처리할 마지막 페이지 (기본 3)
+        
+    Returns:
+        메타데이터 딕셔너리: {"title": str, "authors": list[str], "abstract": str, "keywords": list}
     """
-    # 더미 구현
-    return [
-        {"id": "kw-1", "name": "Keyword 1", "importance": 8},
-        {"id": "kw-2", "name": "Keyword 2", "importance": 7},
-    ]
+    result = await _process_pdf_with_grobid(
+        pdf_bytes,
+        service="processHeaderDocument",
+        start=1,
+        end=end_page,
+    )
+    
+    return _to_metadata(result)
@@ -7,11 +7,19 @@ TODO: 공통 유틸리티 함수 구현
 """
 
 from app.utils.grobid_xml_to_json import (
+    ParsedPaper,
+    ParsedSection,
+    convert_grobid_dir,
     convert_grobid_xml_to_json,
     parse_grobid_xml,
+    parse_grobid_xml_string,
 )
 
 __all__ = [
     "parse_grobid_xml",
+    "parse_grobid_xml_string",
     "convert_grobid_xml_to_json",
+    "convert_grobid_dir",
+    "ParsedPaper",
+    "ParsedSection",
 ]
@@ -4,27 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import re
-from difflib import SequenceMatcher
 from typing import Any
 
 import arxiv
+from rapidfuzz import fuzz
 
-_ARXIV_MAX_RESULTS = 20
+_ARXIV_MAX_RESULTS = 5
+# 이 이상이면 사실상 같은 제목으로 보고 남은 결과는 조회하지 않음
+_EARLY_STOP_SCORE = 0.95
+_WS_RE = re.compile(r"\s+")
 
 
 def _normalize_text(text: str) -> str:
     """공백 정규화 후 소문자."""
     if not text:
         return ""
-    return re.sub(r"\s+", " ", text.strip().lower())
+    return _WS_RE.sub(" ", text.strip().lower())
 
 
 def _similarity(query_norm: str, title: str) -> float:
-    """query와 title 문자열 유사도 0~1."""
+    """query와 title의 단어 순서 무관 유사도 0~1 (rapidfuzz token_sort_ratio)."""
     title_norm = _normalize_text(title)
     if not query_norm or not title_norm:
         return 0.0
-    return SequenceMatcher(None, query_norm, title_norm).ratio()
+    return fuzz.token_sort_ratio(query_norm, title_norm) / 100.0
 
 
 def _search_arxiv_and_pick_best(query: str, max_results: int = 5) -> dict[str, Any] | None:
@@ -33,7 +36,8 @@ def _search_arxiv_and_pick_best(query: str, max_results: int = 5) -> dict[str, A
         return None
     q = query.strip()
     query_norm = _normalize_text(q)
-    client = arxiv.Client()
+    # 기본 page_size(100)는 max_results와 무관하게 100건을 받아오므로 필요한 만큼만 요청
+    client = arxiv.Client(page_size=max_results)
     search = arxiv.Search(query=q, max_results=max_results)
     candidates: list[dict[str, Any]] = []
     try:
@@ -49,7 +53,7 @@ def _search_arxiv_and_pick_best(query: str, max_results: int = 5) -> dict[str, A
                 "title": title,
                 "_score": score,
             })
-            if len(candidates) >= max_results:
+            if score >= _EARLY_STOP_SCORE:
                 break
     except Exception:
         pass
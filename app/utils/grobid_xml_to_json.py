@@ -3,17 +3,96 @@
 GROBID에서 생성된 TEI XML 파일을 JSON 형식으로 변환합니다.
 """
 
-import json
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-from xml.etree import ElementTree as ET
+from typing import Any, TypedDict
+
+import orjson
+from lxml import etree as ET
 
 # TEI XML 네임스페이스 (GROBID가 사용하는 표준)
 # 모든 XML 요소 앞에 이 네임스페이스가 붙습니다
 NS = {'tei': 'http://www.tei-c.org/ns/1.0'}
 
-# 네임스페이스를 포함한 태그를 쉽게 만들기 위한 헬퍼
+# 공백만 있는 텍스트 노드와 주석을 파싱 단계에서 제거하고, 일부 깨진 XML도 복구하여 파싱
+_PARSE_OPTIONS: dict[str, Any] = {
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "remove_pis": True,
+    "recover": True,
+    "huge_tree": False,
+}
+
+
+class ParsedSection(TypedDict):
+    """본문 섹션 (subtitle: 섹션 번호 + 제목, text: 단락을 이어 붙인 본문)"""
+    subtitle: str
+    text: str
+
+
+class ParsedPaper(TypedDict):
+    """GROBID TEI 파싱 결과 (papers.extracted_text JSONB 컬럼에 그대로 저장)"""
+    title: str
+    author: list[str]
+    abstract: str
+    body: list[ParsedSection]
+
+
+# 연속 공백 정규화용
+_WS_RE = re.compile(r"\s+")
+
+# GROBID가 그림 캡션 등을 섹션으로 잘못 인식한 제목
+# ("Input-Input", "Attention Visualizations", 공백 없이 숫자가 붙은 "Layer5", "Figure3" 등)
+# 인라인 요소 사이를 공백으로 이어 붙인 head 텍스트에 적용해야 함
+# (XPath string()은 공백 없이 이어 붙여 "Figure<ref>3</ref>"가 "Figure3"이 됨)
+_INVALID_HEAD_RE = re.compile(
+    r"Input-Input|Output-Output|Attention Visualizations|(?:Layer|Figure|Table)\d+"
+)
+
+# 긴 제목의 마지막 마침표 뒤 문장 (앞뒤 공백 제외 21자 이상)
+_TITLE_TAIL_RE = re.compile(r"\.\s*([^.]{21,})$")
+
+# 초록 뒤에 붙는 각주/기여도 설명 ("* Equal contribution", "† Work performed" 등)
+_FOOTNOTE_RE = re.compile(r"[*†‡] |Work performed")
+
+
+# 자주 쓰는 경로는 모듈 로드 시 한 번만 컴파일 (호출마다 경로 문자열을 다시 해석하지 않음)
+def _xpath(path: str) -> ET.XPath:
+    return ET.XPath(path, namespaces=NS)
+
+
+_XP_ANALYTIC = _xpath("descendant::tei:analytic")
+
+# titleStmt, analytic의 주 제목을 한 번의 탐색으로 (문서 순서 = titleStmt 우선)
+_XP_TITLE_MAIN = _xpath(
+    "descendant::tei:titleStmt//tei:title[@type='main']"
+    " | descendant::tei:analytic//tei:title[@type='main']"
+)
+
+_XP_ABSTRACT = _xpath("descendant::tei:abstract")
+_XP_ABSTRACT_P = _xpath("descendant::tei:p")
+_XP_AUTHORS = _xpath("descendant::tei:author")
+_XP_PERSNAME = _xpath("descendant::tei:persName")
+_XP_FORENAMES = _xpath("descendant::tei:forename")
+_XP_SURNAME = _xpath("descendant::tei:surname")
+_XP_AFFILIATION = _xpath("descendant::tei:affiliation")
+_XP_ORG_NAMES = _xpath("tei:orgName")
+_XP_EMAIL = _xpath("descendant::tei:email")
+_XP_HEAD = _xpath("tei:head")
+
+
+def _first(xpath: ET.XPath, element: ET._Element) -> ET._Element | None:
+    """컴파일된 XPath의 첫 번째 결과 (없으면 None) — find()와 같은 의미"""
+    result = xpath(element)
+    return result[0] if result else None
+
+
+# 네임스페이스를 포함한 태그를 쉽게 만들기 위한 헬퍼 (태그 종류가 적으므로 결과를 캐싱)
+@lru_cache(maxsize=None)
 def tei(tag: str) -> str:
     """TEI 네임스페이스가 포함된 태그를 반환합니다.
     
@@ -29,7 +108,18 @@ def tei(tag: str) -> str:
     return f"{{{NS['tei']}}}{tag}"
 
 
-def extract_text(element: ET.Element | None, skip_tags: set[str] | None = None) -> str:
+# 태그 비교에 반복 사용되는 네임스페이스 태그는 모듈 로드 시 한 번만 생성
+_TAG_P, _TAG_DIV, _TAG_BODY, _TAG_TEIHEADER = (
+    tei(t) for t in ("p", "div", "body", "teiHeader")
+)
+
+
+def _extract_text_fast(element: ET._Element) -> str:
+    """skip_tags 없이 요소의 모든 텍스트를 공백 정규화하여 반환 (내부 파서용 빠른 경로)"""
+    return _WS_RE.sub(" ", " ".join(element.itertext())).strip()
+
+
+def extract_text(element: ET._Element | None, skip_tags: set[str] | None = None) -> str:
     """XML 요소에서 텍스트를 추출합니다.
     
     Args:
@@ -42,33 +132,27 @@ def extract_text(element: ET.Element | None, skip_tags: set[str] | None = None)
     if element is None:
         return ""
     
-    if skip_tags is None:
-        skip_tags = set()
+    if not skip_tags:
+        # 하위 요소의 텍스트/tail을 문서 순서대로 C 레벨에서 순회
+        return _extract_text_fast(element)
     
-    # 요소의 직접 텍스트
+    # skip_tags에 포함된 태그는 하위 트리를 건너뛰되, 그 뒤의 tail 텍스트는 유지
     text_parts = []
-    if element.text:
-        text_parts.append(element.text.strip())
-    
-    # 자식 요소들의 텍스트
-    for child in element:
-        # skip_tags에 포함된 태그는 건너뜀
-        if child.tag not in skip_tags:
-            child_text = extract_text(child, skip_tags)
-            if child_text:
-                text_parts.append(child_text)
-        # 자식 요소 다음의 tail 텍스트
-        if child.tail:
-            text_parts.append(child.tail.strip())
-    
-    # 여러 공백을 하나로 합치고 앞뒤 공백 제거
-    result = " ".join(text_parts).strip()
-    # 연속된 공백을 하나로 합치기
-    result = " ".join(result.split())
-    return result
+    walker = ET.iterwalk(element, events=("start", "end"))
+    for event, node in walker:
+        if event == "start":
+            if node is not element and node.tag in skip_tags:
+                walker.skip_subtree()
+            elif node.text:
+                text_parts.append(node.text)
+        elif node is not element and node.tail:
+            text_parts.append(node.tail)
+    
+    # 연속된 공백을 하나로 합치고 앞뒤 공백 제거
+    return _WS_RE.sub(" ", " ".join(text_parts)).strip()
 
 
-def parse_author(author_elem: ET.Element) -> str:
+def parse_author(author_elem: ET._Element) -> str:
     """저자 정보를 파싱합니다.
     
     Args:
@@ -80,11 +164,11 @@ def parse_author(author_elem: ET.Element) -> str:
     parts = []
     
     # 이름 정보
-    pers_name = author_elem.find(f".//{tei('persName')}")
+    pers_name = _first(_XP_PERSNAME, author_elem)
     if pers_name is not None:
         name_parts = []
-        forenames = pers_name.findall(f".//{tei('forename')}")
-        surname = pers_name.find(f".//{tei('surname')}")
+        forenames = _XP_FORENAMES(pers_name)
+        surname = _first(_XP_SURNAME, pers_name)
         
         for forename in forenames:
             if forename.text:
@@ -100,11 +184,11 @@ def parse_author(author_elem: ET.Element) -> str:
     
     # 소속 정보 - 첫 번째 유효한 소속만 사용
     # affiliation의 직접 자식 orgName 중 첫 번째만 사용
-    affiliation = author_elem.find(f".//{tei('affiliation')}")
+    affiliation = _first(_XP_AFFILIATION, author_elem)
     if affiliation is not None:
         # type="department" 또는 type="institution"인 첫 번째 orgName 찾기
         org_name = None
-        for org in affiliation.findall(tei('orgName')):
+        for org in _XP_ORG_NAMES(affiliation):
             org_type = org.get("type", "")
             if org_type in ["department", "institution"] and org.text and org.text.strip():
                 org_name = org.text.strip()
@@ -114,14 +198,27 @@ def parse_author(author_elem: ET.Element) -> str:
             parts.append(org_name)
     
     # 이메일
-    email = author_elem.find(f".//{tei('email')}")
+    email = _first(_XP_EMAIL, author_elem)
     if email is not None and email.text:
         parts.append(email.text.strip())
     
     return " ".join(parts)
 
 
-def parse_title(tei_header: ET.Element) -> str:
+def _clean_title(title_text: str) -> str:
+    """GROBID lightweight 버전에서 가끔 불필요한 앞부분 텍스트가 포함되는 경우를 정리합니다.
+    
+    제목이 비정상적으로 길고(150자 이상) 마침표로 구분된 경우,
+    마지막 문장이 실제 제목처럼 보이면(20자 이상, 대문자로 시작) 그것을 제목으로 간주합니다.
+    """
+    if len(title_text) > 150:
+        match = _TITLE_TAIL_RE.search(title_text)
+        if match and match.group(1)[0].isupper():
+            return match.group(1)
+    return title_text
+
+
+def parse_title(tei_header: ET._Element) -> str:
     """제목을 파싱합니다.
     
     Args:
@@ -130,45 +227,16 @@ def parse_title(tei_header: ET.Element) -> str:
     Returns:
         제목 문자열
     """
-    # titleStmt에서 제목 찾기
-    title_stmt = tei_header.find(f".//{tei('titleStmt')}")
-    if title_stmt is not None:
-        title_elem = title_stmt.find(f".//{tei('title')}[@type='main']")
-        if title_elem is not None:
-            title_text = extract_text(title_elem).strip()
-            if title_text:
-                # GROBID lightweight 버전에서 가끔 불필요한 앞부분 텍스트가 포함되는 경우
-                # 제목이 비정상적으로 길고(150자 이상) 마침표로 구분된 경우
-                # 마지막 문장을 실제 제목으로 간주
-                if len(title_text) > 150 and '.' in title_text:
-                    last_period = title_text.rfind('.')
-                    if last_period != -1 and last_period < len(title_text) - 1:
-                        potential_title = title_text[last_period + 1:].strip()
-                        # 마지막 부분이 실제 제목처럼 보이는 경우 (20자 이상, 대문자로 시작)
-                        if len(potential_title) > 20 and potential_title[0].isupper():
-                            return potential_title
-                return title_text
-    
-    # analytic에서 제목 찾기
-    analytic = tei_header.find(f".//{tei('analytic')}")
-    if analytic is not None:
-        title_elem = analytic.find(f".//{tei('title')}[@type='main']")
-        if title_elem is not None:
-            title_text = extract_text(title_elem).strip()
-            if title_text:
-                # 동일한 로직 적용
-                if len(title_text) > 150 and '.' in title_text:
-                    last_period = title_text.rfind('.')
-                    if last_period != -1 and last_period < len(title_text) - 1:
-                        potential_title = title_text[last_period + 1:].strip()
-                        if len(potential_title) > 20 and potential_title[0].isupper():
-                            return potential_title
-                return title_text
+    # titleStmt, analytic 순서로 비어 있지 않은 첫 제목 사용
+    for title_elem in _XP_TITLE_MAIN(tei_header):
+        title_text = _extract_text_fast(title_elem)
+        if title_text:
+            return _clean_title(title_text)
     
     return ""
 
 
-def parse_abstract(tei_header: ET.Element) -> str:
+def parse_abstract(tei_header: ET._Element) -> str:
     """초록을 파싱합니다.
     
     Args:
@@ -177,22 +245,17 @@ def parse_abstract(tei_header: ET.Element) -> str:
     Returns:
         초록 문자열
     """
-    abstract_elem = tei_header.find(f".//{tei('abstract')}")
+    abstract_elem = _first(_XP_ABSTRACT, tei_header)
     if abstract_elem is None:
         return ""
     
-    # 각주나 기여도 설명 등을 제외하기 위한 패턴
-    # "* Equal contribution", "† Work performed", "‡ Work performed" 등으로 시작하는 단락 제외
-    footnote_patterns = ["* ", "† ", "‡ ", "* Equal", "Work performed"]
-    
     # abstract 안의 첫 번째 <p> 태그만 추출 (일반적으로 실제 초록)
     paragraphs = []
-    for p in abstract_elem.findall(f".//{tei('p')}"):
-        p_text = extract_text(p).strip()
+    for p in _XP_ABSTRACT_P(abstract_elem):
+        p_text = _extract_text_fast(p)
         if p_text:
             # 각주로 보이는 단락은 제외
-            is_footnote = any(p_text.startswith(pattern) for pattern in footnote_patterns)
-            if not is_footnote:
+            if not _FOOTNOTE_RE.match(p_text):
                 paragraphs.append(p_text)
             else:
                 # 각주가 발견되면 이후 단락은 모두 각주로 간주하고 중단
@@ -201,7 +264,7 @@ def parse_abstract(tei_header: ET.Element) -> str:
     return " ".join(paragraphs).strip()
 
 
-def parse_authors(tei_header: ET.Element) -> list[str]:
+def parse_authors(tei_header: ET._Element) -> list[str]:
     """저자 목록을 파싱합니다.
     
     Args:
@@ -213,9 +276,9 @@ def parse_authors(tei_header: ET.Element) -> list[str]:
     authors = []
     
     # analytic 안의 모든 author 요소 찾기
-    analytic = tei_header.find(f".//{tei('analytic')}")
+    analytic = _first(_XP_ANALYTIC, tei_header)
     if analytic is not None:
-        author_elems = analytic.findall(f".//{tei('author')}")
+        author_elems = _XP_AUTHORS(analytic)
         for author_elem in author_elems:
             author_str = parse_author(author_elem)
             if author_str:
@@ -224,7 +287,7 @@ def parse_authors(tei_header: ET.Element) -> list[str]:
     return authors
 
 
-def parse_body(body_elem: ET.Element) -> list[dict[str, str]]:
+def parse_body(body_elem: ET._Element) -> list[ParsedSection]:
     """본문을 파싱합니다.
     
     Args:
@@ -233,37 +296,25 @@ def parse_body(body_elem: ET.Element) -> list[dict[str, str]]:
     Returns:
         본문 섹션 리스트 (각 섹션은 subtitle과 text를 포함)
     """
-    sections = []
-    
-    # body의 직접 자식 div 요소만 처리 (중첩된 div는 재귀적으로 처리)
-    direct_divs = body_elem.findall(tei('div'))
+    sections: list[ParsedSection] = []
     
-    def process_div(div: ET.Element, parent_sections: list[dict[str, str]]) -> None:
-        """div 요소를 재귀적으로 처리합니다."""
+    # 중첩 div를 재귀 대신 명시적 스택으로 문서 순서대로(깊이 우선) 처리
+    stack = list(body_elem.iterchildren(_TAG_DIV, reversed=True))
+    while stack:
+        div = stack.pop()
+        
         # head 요소 (subtitle) - div의 직접 자식 head만
-        head = div.find(tei('head'))
+        head = _first(_XP_HEAD, div)
         
         subtitle = ""
         if head is not None:
             # head의 n 속성 (섹션 번호) 가져오기
             section_number = head.get("n", "")
-            head_text = extract_text(head).strip()
+            head_text = _extract_text_fast(head)
             
-            # 잘못된 섹션 제목 필터링
-            # GROBID가 그림 캡션이나 기타 메타데이터를 섹션으로 잘못 인식하는 경우
-            if head_text:
-                # 패턴: "Input-Input", "Layer" + 숫자, "Figure" + 숫자 등
-                invalid_patterns = [
-                    "Input-Input",
-                    "Output-Output", 
-                    "Attention Visualizations"
-                ]
-                # 의심스러운 패턴 체크
-                if any(pattern in head_text for pattern in invalid_patterns):
-                    return  # 이 섹션은 무시
-                # "Layer5", "Figure3" 같은 패턴 체크 (공백 없이 숫자가 붙은 경우)
-                if re.search(r'(Layer|Figure|Table)\d+', head_text):
-                    return  # 이 섹션은 무시
+            # 잘못된 섹션 제목 필터링 (하위 div까지 모두 무시)
+            if head_text and _INVALID_HEAD_RE.search(head_text):
+                continue
             
             # 섹션 번호와 제목 결합
             if section_number and head_text:
@@ -272,61 +323,59 @@ def parse_body(body_elem: ET.Element) -> list[dict[str, str]]:
                 subtitle = head_text
         
         # p 요소들 (text) - div의 직접 자식 p만 (중첩 div의 p는 제외)
-        paragraphs = []
-        for child in div:
-            if child.tag == tei('p'):
-                p_text = extract_text(child).strip()
-                if p_text:
-                    # "6 Results"와 같이 숫자로 시작하는 짧은 제목은 제외
-                    # (이것은 실제로는 다음 섹션의 제목일 가능성이 높음)
-                    if len(p_text) < 20 and p_text.split()[0].isdigit():
-                        continue
-                    paragraphs.append(p_text)
-        
-        text = " ".join(paragraphs).strip()
+        # "6 Results"와 같이 숫자로 시작하는 짧은 단락은 제외
+        # (이것은 실제로는 다음 섹션의 제목일 가능성이 높음)
+        p_texts = (_extract_text_fast(child) for child in div.iterchildren(_TAG_P))
+        text = " ".join(
+            p_text for p_text in p_texts
+            if p_text and not (len(p_text) < 20 and p_text.split(None, 1)[0].isdigit())
+        )
         
         # subtitle이나 text가 있는 경우 섹션 추가
         if subtitle or text:
-            parent_sections.append({
+            sections.append({
                 "subtitle": subtitle,
                 "text": text
             })
         
-        # 중첩된 div 처리
-        nested_divs = div.findall(tei('div'))
-        for nested_div in nested_divs:
-            process_div(nested_div, parent_sections)
-    
-    # 모든 직접 자식 div 처리
-    for div in direct_divs:
-        process_div(div, sections)
+        # 중첩된 div는 역순으로 쌓아 원래 순서대로 꺼내지도록 함
+        stack.extend(div.iterchildren(_TAG_DIV, reversed=True))
     
     return sections
 
 
-def parse_grobid_xml(xml_path: str | Path) -> dict[str, Any]:
-    """GROBID XML 파일을 JSON 형식으로 파싱합니다.
+def _iterparse_tei(source: str | io.BytesIO) -> ParsedPaper:
+    """teiHeader와 body만 스트리밍으로 파싱하여 논문 정보를 추출합니다.
+    
+    전체 트리를 메모리에 올리지 않고, body가 끝나면 그 뒤(참고문헌 등 <back>)는
+    읽지 않고 중단합니다. 이미 처리된 앞쪽 형제 요소(<front> 등)는 삭제합니다.
     
     Args:
-        xml_path: GROBID XML 파일 경로
+        source: XML 파일 경로 또는 바이트 스트림
         
     Returns:
         파싱된 논문 정보 딕셔너리
     """
-    xml_path = Path(xml_path)
-    
-    if not xml_path.exists():
-        raise FileNotFoundError(f"XML 파일을 찾을 수 없습니다: {xml_path}")
+    tei_header = None
+    body_elem = None
     
-    # XML 파싱
     try:
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        context = ET.iterparse(
+            source, events=("end",), tag=(_TAG_TEIHEADER, _TAG_BODY), **_PARSE_OPTIONS
+        )
+        for _, elem in context:
+            if elem.tag == _TAG_TEIHEADER:
+                tei_header = elem
+            else:
+                body_elem = elem
+                # body 앞의 형제 요소는 더 이상 필요 없으므로 해제
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            if tei_header is not None and body_elem is not None:
+                break
     except ET.ParseError as e:
         raise ValueError(f"XML 파싱 오류: {e}") from e
     
-    # teiHeader 찾기
-    tei_header = root.find(f".//{tei('teiHeader')}")
     if tei_header is None:
         raise ValueError("teiHeader를 찾을 수 없습니다.")
     
@@ -340,13 +389,12 @@ def parse_grobid_xml(xml_path: str | Path) -> dict[str, Any]:
     abstract = parse_abstract(tei_header)
     
     # 본문 파싱
-    body_elem = root.find(f".//{tei('body')}")
-    body_sections = []
+    body_sections: list[ParsedSection] = []
     if body_elem is not None:
         body_sections = parse_body(body_elem)
     
     # JSON 구조 생성
-    result = {
+    result: ParsedPaper = {
         "title": title,
         "author": authors,
         "abstract": abstract,
@@ -356,10 +404,43 @@ def parse_grobid_xml(xml_path: str | Path) -> dict[str, Any]:
     return result
 
 
+def parse_grobid_xml(xml_path: str | Path) -> ParsedPaper:
+    """GROBID XML 파일을 JSON 형식으로 파싱합니다.
+    
+    Args:
+        xml_path: GROBID XML 파일 경로
+        
+    Returns:
+        파싱된 논문 정보 딕셔너리
+    """
+    xml_path = Path(xml_path)
+    
+    if not xml_path.exists():
+        raise FileNotFoundError(f"XML 파일을 찾을 수 없습니다: {xml_path}")
+    
+    return _iterparse_tei(str(xml_path))
+
+
+def parse_grobid_xml_string(xml_text: str | bytes) -> ParsedPaper:
+    """GROBID 응답 XML을 파일 없이 메모리에서 바로 파싱합니다.
+    
+    Args:
+        xml_text: GROBID TEI XML 문자열 또는 바이트
+        
+    Returns:
+        파싱된 논문 정보 딕셔너리
+    """
+    if isinstance(xml_text, str):
+        # lxml은 encoding 선언이 있는 str을 받지 않으므로 바이트로 변환
+        xml_text = xml_text.encode("utf-8")
+    
+    return _iterparse_tei(io.BytesIO(xml_text))
+
+
 def convert_grobid_xml_to_json(
     xml_path: str | Path,
     output_path: str | Path | None = None
-) -> dict[str, Any]:
+) -> ParsedPaper:
     """GROBID XML 파일을 JSON으로 변환합니다.
     
     Args:
@@ -375,8 +456,42 @@ def convert_grobid_xml_to_json(
     if output_path is not None:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent="\t")
+        output_path.write_bytes(orjson.dumps(result, option=orjson.OPT_INDENT_2))
     
     return result
+
+
+def _convert_to_file(xml_path: Path, output_path: Path) -> None:
+    """워커 프로세스용: 변환 결과는 파일로만 저장하고 반환하지 않음 (프로세스 간 전송 비용 절감)"""
+    convert_grobid_xml_to_json(xml_path, output_path)
+
+
+def convert_grobid_dir(
+    xml_dir: str | Path,
+    out_dir: str | Path,
+    workers: int | None = None
+) -> None:
+    """디렉토리의 GROBID XML 파일들을 여러 프로세스에서 병렬로 JSON 변환합니다.
+    
+    파싱은 CPU 작업이므로 파일 단위로 프로세스에 나누어 처리합니다.
+    
+    Args:
+        xml_dir: GROBID XML 파일들이 있는 디렉토리
+        out_dir: 출력 JSON 디렉토리 (파일명은 XML 파일명.json)
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+    """
+    xml_dir = Path(xml_dir)
+    out_dir = Path(out_dir)
+    
+    xml_paths = sorted(xml_dir.glob("*.xml"))
+    if not xml_paths:
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    output_paths = [out_dir / f"{xml_path.stem}.json" for xml_path in xml_paths]
+    chunksize = max(1, len(xml_paths) // (workers * 4))
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 결과를 소비해야 워커에서 발생한 예외가 호출자에게 전달됨
+        for _ in executor.map(_convert_to_file, xml_paths, output_paths, chunksize=chunksize):
+            pass
@@ -9,7 +9,10 @@ set -e
 echo "🧪 Running tests..."
 
 # pytest 실행 with coverage
+# -n auto: pytest-xdist로 CPU 코어 수만큼 워커를 띄워 Supabase I/O 대기 테스트를 병렬 실행
+#          (테스트 데이터는 uuid로 격리되어 있고, 세션 fixture는 워커마다 하나씩 생성됨)
 pytest tests/ \
+    -n auto \
     --cov=app \
     --cov-report=term-missing \
     --cov-report=html:coverage_html \
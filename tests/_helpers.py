@@ -0,0 +1,17 @@
+"""Small helpers shared by the test modules."""
+
+from __future__ import annotations
+
+import uuid
+
+
+def unique_name(prefix: str) -> str:
+    """Return ``prefix`` followed by a random hex suffix, e.g. for titles."""
+
+    return f"{prefix} {uuid.uuid4().hex}"
+
+
+def new_email() -> str:
+    """Return a throwaway email address that is unique per call."""
+
+    return f"test-{uuid.uuid4().hex}@example.com"
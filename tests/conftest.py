@@ -6,16 +6,36 @@ TODO: 실제 테스트 환경 구성
 - 인증 fixture
 """
 
+from collections.abc import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.core.config import settings
 from app.main import app
 
 
+@pytest.fixture(scope="session")
+def _session_client() -> Iterator[TestClient]:
+    """세션 전체에서 공유하는 테스트 클라이언트 (앱 lifespan을 한 번만 실행)"""
+    with TestClient(app) as c:
+        yield c
+
+
 @pytest.fixture
-def client() -> TestClient:
-    """테스트 클라이언트 fixture"""
-    return TestClient(app)
+def client(_session_client: TestClient) -> TestClient:
+    """테스트 클라이언트 fixture
+
+    클라이언트는 세션 단위로 공유하되, 쿠키는 테스트 간에 섞이지 않도록 매번 비웁니다.
+    """
+    _session_client.cookies.clear()
+    return _session_client
+
+
+@pytest.fixture(scope="session")
+def supabase_available() -> bool:
+    """Supabase 연동 테스트 실행 가능 여부 (세션당 한 번만 판단)"""
+    return bool(settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY)
 
 
 @pytest.fixture
@@ -0,0 +1,87 @@
+"""Shared fixtures for Supabase CRUD integration tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+import pytest_asyncio
+
+from app.crud import users
+from app.crud.supabase_client import get_supabase_client
+from tests._helpers import new_email
+
+# Junction rows and refresh tokens cascade from users/papers/curriculums, so
+# registering the parent row is usually enough.
+_CLEANUP_TABLES = ("refresh_tokens", "curriculums", "papers", "users")
+
+
+@pytest.fixture(autouse=True)
+def _require_supabase(supabase_available: bool) -> None:
+    """Skip every CRUD integration test when Supabase is not configured."""
+
+    if not supabase_available:
+        pytest.skip("Supabase env not configured (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY).")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _warm_supabase_pool(supabase_available: bool) -> None:
+    """Open the PostgREST connection once before the first CRUD test.
+
+    The TLS/TCP handshake is charged to fixture setup instead of the first
+    test, and bad credentials fail fast here. ``get_supabase_client`` caches
+    one client per event loop and all tests run on the session loop, so the
+    ``app.crud.*`` helpers reuse this warmed connection pool.
+    """
+
+    if not supabase_available:
+        return
+
+    client = await get_supabase_client()
+    await client.table("users").select("id", head=True).limit(1).execute()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def cleanup_registry() -> AsyncIterator[dict[str, set[str]]]:
+    """Collect ids of throwaway rows and bulk-delete them once at session end.
+
+    Tests add ids (e.g. ``cleanup_registry["users"].add(user_id)``) instead of
+    issuing one delete per row, so teardown costs one round-trip per table.
+    """
+
+    registry: dict[str, set[str]] = {table: set() for table in _CLEANUP_TABLES}
+    yield registry
+
+    if not any(registry.values()):
+        return
+
+    # Requested lazily so sessions without Supabase config never build a client
+    client = await get_supabase_client()
+    for table in _CLEANUP_TABLES:
+        ids = registry[table]
+        if ids:
+            await client.table(table).delete().in_("id", sorted(ids)).execute()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def scratch_user(
+    supabase_available: bool, cleanup_registry: dict[str, set[str]]
+) -> dict[str, Any]:
+    """One throwaway user shared by tests that only attach rows to it.
+
+    Tests that mutate the user row itself must create their own user. Session
+    fixtures are set up before the autouse skip runs, so this checks
+    ``supabase_available`` itself.
+    """
+
+    if not supabase_available:
+        pytest.skip("Supabase env not configured (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY).")
+
+    user = await users.create_user(
+        email=new_email(),
+        password_hash="hash",
+        name="Scratch User",
+    )
+    cleanup_registry["users"].add(str(user["id"]))
+    return user
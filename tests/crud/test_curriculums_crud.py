@@ -1,25 +1,16 @@
 from __future__ import annotations
 
-import uuid
-
 import pytest
 
-from app.core.config import settings
 from app.crud import curriculums
 from app.crud.errors import NotFoundError
-
-
-def _skip_if_no_supabase() -> None:
-    if not (settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY):
-        pytest.skip("Supabase env not configured (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY).")
+from tests._helpers import unique_name
 
 
 @pytest.mark.asyncio
 async def test_curriculums_crud_roundtrip() -> None:
-    _skip_if_no_supabase()
-
     created = await curriculums.create_curriculum(
-        title=f"Test Curriculum {uuid.uuid4().hex}",
+        title=unique_name("Test Curriculum"),
         status="draft",
         purpose="simple_study",
         level="bachelor",
@@ -39,12 +30,11 @@ async def test_curriculums_crud_roundtrip() -> None:
         updated = await curriculums.update_curriculum(curriculum_id, status="ready")
         assert updated["status"] == "ready"
 
-        items, total = await curriculums.list_curriculums(page=1, limit=50)
-        assert total >= 1
-        assert any(c["id"] == curriculum_id for c in items)
-
-        items2, _ = await curriculums.list_curriculums(status="ready", page=1, limit=50)
-        assert any(c["id"] == curriculum_id for c in items2)
+        items, total = await curriculums.list_curriculums(
+            status="ready", page=1, limit=1, filters={"id": curriculum_id}
+        )
+        assert total == 1
+        assert items[0]["id"] == curriculum_id
     finally:
         await curriculums.delete_curriculum(curriculum_id)
 
@@ -1,55 +1,60 @@
 from __future__ import annotations
 
-import uuid
+import asyncio
 
 import pytest
 
-from app.core.config import settings
 from app.crud import curriculums, junctions, papers, users
-
-
-def _skip_if_no_supabase() -> None:
-    if not (settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY):
-        pytest.skip("Supabase env not configured (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY).")
+from tests._helpers import new_email, unique_name
 
 
 @pytest.mark.asyncio
-async def test_junctions_linking() -> None:
-    _skip_if_no_supabase()
-
-    user = await users.create_user(
-        email=f"test-{uuid.uuid4().hex}@example.com",
-        password_hash="hash",
-        name="Junction User",
+async def test_junctions_linking(cleanup_registry: dict[str, set[str]]) -> None:
+    user, paper, curriculum = await asyncio.gather(
+        users.create_user(
+            email=new_email(),
+            password_hash="hash",
+            name="Junction User",
+        ),
+        papers.create_paper(title=unique_name("Junction Paper")),
+        curriculums.create_curriculum(title=unique_name("Junction Curriculum")),
     )
-    paper = await papers.create_paper(title=f"Junction Paper {uuid.uuid4().hex}")
-    curriculum = await curriculums.create_curriculum(title=f"Junction Curriculum {uuid.uuid4().hex}")
 
     user_id = user["id"]
     paper_id = paper["id"]
     curriculum_id = curriculum["id"]
+    cleanup_registry["users"].add(user_id)
+    cleanup_registry["papers"].add(paper_id)
+    cleanup_registry["curriculums"].add(curriculum_id)
+
+    await junctions.add_links(
+        user_papers=[(user_id, paper_id)],
+        user_curriculums=[(user_id, curriculum_id)],
+        curriculum_papers=[(curriculum_id, paper_id)],
+    )
+    # Re-linking existing pairs is a no-op rather than a conflict (needs the junction PKs)
+    await junctions.add_links(user_papers=[(user_id, paper_id)], ignore_duplicates=True)
+
+    assert await junctions.user_paper_exists(user_id=user_id, paper_id=paper_id)
+    assert await junctions.user_curriculum_exists(user_id=user_id, curriculum_id=curriculum_id)
+    assert await junctions.curriculum_paper_exists(curriculum_id=curriculum_id, paper_id=paper_id)
+
+    # The base rows are fresh, so each list holds exactly the one link
+    up_rows, up_total = await junctions.list_user_papers(user_id=user_id, page=1, limit=1)
+    assert up_total == 1 and up_rows[0]["paper_id"] == paper_id
+
+    uc_rows, uc_total = await junctions.list_user_curriculums(user_id=user_id, page=1, limit=1)
+    assert uc_total == 1 and uc_rows[0]["curriculum_id"] == curriculum_id
+
+    cp_rows, cp_total = await junctions.list_curriculum_papers(curriculum_id=curriculum_id, page=1, limit=1)
+    assert cp_total == 1 and cp_rows[0]["paper_id"] == paper_id
+
+    # Unlink
+    await junctions.remove_curriculum_paper(curriculum_id=curriculum_id, paper_id=paper_id)
+    await junctions.remove_user_curriculum(user_id=user_id, curriculum_id=curriculum_id)
+    await junctions.remove_user_paper(user_id=user_id, paper_id=paper_id)
 
-    try:
-        await junctions.add_user_paper(user_id=user_id, paper_id=paper_id)
-        await junctions.add_user_curriculum(user_id=user_id, curriculum_id=curriculum_id)
-        await junctions.add_curriculum_paper(curriculum_id=curriculum_id, paper_id=paper_id)
-
-        up_rows, _ = await junctions.list_user_papers(user_id=user_id, page=1, limit=50)
-        assert any(r["paper_id"] == paper_id for r in up_rows)
-
-        uc_rows, _ = await junctions.list_user_curriculums(user_id=user_id, page=1, limit=50)
-        assert any(r["curriculum_id"] == curriculum_id for r in uc_rows)
-
-        cp_rows, _ = await junctions.list_curriculum_papers(curriculum_id=curriculum_id, page=1, limit=50)
-        assert any(r["paper_id"] == paper_id for r in cp_rows)
-
-        # Unlink
-        await junctions.remove_curriculum_paper(curriculum_id=curriculum_id, paper_id=paper_id)
-        await junctions.remove_user_curriculum(user_id=user_id, curriculum_id=curriculum_id)
-        await junctions.remove_user_paper(user_id=user_id, paper_id=paper_id)
-    finally:
-        # Cleanup base records
-        await curriculums.delete_curriculum(curriculum_id)
-        await papers.delete_paper(paper_id)
-        await users.delete_user(user_id)
+    assert not await junctions.user_paper_exists(user_id=user_id, paper_id=paper_id)
+    assert not await junctions.user_curriculum_exists(user_id=user_id, curriculum_id=curriculum_id)
+    assert not await junctions.curriculum_paper_exists(curriculum_id=curriculum_id, paper_id=paper_id)
 
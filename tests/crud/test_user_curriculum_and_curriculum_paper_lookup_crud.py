@@ -1,72 +1,66 @@
 from __future__ import annotations
 
-import uuid
+import asyncio
+from typing import Any
 
 import pytest
 
-from app.core.config import settings
 from app.crud import curriculums, junctions, papers, users
-
-
-def _skip_if_no_supabase() -> None:
-    if not (settings.SUPABASE_URL and settings.SUPABASE_SERVICE_ROLE_KEY):
-        pytest.skip("Supabase env not configured (SUPABASE_URL/SUPABASE_SERVICE_ROLE_KEY).")
+from tests._helpers import unique_name
 
 
 @pytest.mark.asyncio
-async def test_user_curriculum_lookup_helpers() -> None:
-    _skip_if_no_supabase()
-
-    email = f"test-{uuid.uuid4().hex}@example.com"
-    user = await users.create_user(email=email, password_hash="hash", name="UC Lookup User")
-    user_id = str(user["id"])
-
-    c1 = await curriculums.create_curriculum(title=f"UC1 {uuid.uuid4().hex}")
-    c2 = await curriculums.create_curriculum(title=f"UC2 {uuid.uuid4().hex}")
+async def test_user_curriculum_lookup_helpers(
+    scratch_user: dict[str, Any], cleanup_registry: dict[str, set[str]]
+) -> None:
+    email = scratch_user["email"]
+    user_id = str(scratch_user["id"])
+    c1, c2 = await asyncio.gather(
+        curriculums.create_curriculum(title=unique_name("UC1")),
+        curriculums.create_curriculum(title=unique_name("UC2")),
+    )
     curr_id_1 = str(c1["id"])
     curr_id_2 = str(c2["id"])
+    cleanup_registry["curriculums"].update((curr_id_1, curr_id_2))
 
-    try:
-        await junctions.add_user_curriculum(user_id=user_id, curriculum_id=curr_id_1)
-        await junctions.add_user_curriculum(user_id=user_id, curriculum_id=curr_id_2)
+    await asyncio.gather(
+        junctions.add_user_curriculum(user_id=user_id, curriculum_id=curr_id_1),
+        junctions.add_user_curriculum(user_id=user_id, curriculum_id=curr_id_2),
+    )
 
-        by_user, total = await curriculums.get_curr_by_user(user_id=user_id, page=1, limit=50)
-        assert total >= 2
-        ids = {c["id"] for c in by_user}
-        assert curr_id_1 in ids and curr_id_2 in ids
+    # One embedded request returns the user together with its curriculums
+    user_row = await users.get_user_with_curriculums(user_id)
+    assert user_row["email"] == email
+    ids = {c["id"] for c in user_row["curriculums"]}
+    assert curr_id_1 in ids and curr_id_2 in ids
 
-        by_email, total2 = await curriculums.get_curr_by_user(email=email, page=1, limit=50)
-        assert total2 == total
+    by_email, total = await curriculums.get_curr_by_user(email=email, page=1, limit=50)
+    assert total == len(ids)
+    assert {c["id"] for c in by_email} == ids
 
-        linked_users, utotal = await users.get_user_by_curr(curriculum_id=curr_id_1, page=1, limit=50)
-        assert utotal >= 1
-        assert any(u["id"] == user_id for u in linked_users)
-    finally:
-        await curriculums.delete_curriculum(curr_id_1)
-        await curriculums.delete_curriculum(curr_id_2)
-        await users.delete_user(user_id)
+    linked_users, utotal = await users.get_user_by_curr(curriculum_id=curr_id_1, page=1, limit=50)
+    assert utotal >= 1
+    assert any(u["id"] == user_id for u in linked_users)
 
 
 @pytest.mark.asyncio
-async def test_curriculum_paper_lookup_helpers() -> None:
-    _skip_if_no_supabase()
-
-    paper = await papers.create_paper(title=f"CP Paper {uuid.uuid4().hex}")
-    curriculum = await curriculums.create_curriculum(title=f"CP Curriculum {uuid.uuid4().hex}")
+async def test_curriculum_paper_lookup_helpers(cleanup_registry: dict[str, set[str]]) -> None:
+    paper, curriculum = await asyncio.gather(
+        papers.create_paper(title=unique_name("CP Paper")),
+        curriculums.create_curriculum(title=unique_name("CP Curriculum")),
+    )
     paper_id = str(paper["id"])
     curriculum_id = str(curriculum["id"])
+    cleanup_registry["papers"].add(paper_id)
+    cleanup_registry["curriculums"].add(curriculum_id)
 
-    try:
-        await junctions.add_curriculum_paper(curriculum_id=curriculum_id, paper_id=paper_id)
+    await junctions.add_curriculum_paper(curriculum_id=curriculum_id, paper_id=paper_id)
 
-        currs, total = await curriculums.get_curr_by_paper(paper_id=paper_id, page=1, limit=50)
-        assert total >= 1
-        assert any(c["id"] == curriculum_id for c in currs)
+    currs, total = await curriculums.get_curr_by_paper(paper_id=paper_id, page=1, limit=50)
+    assert total >= 1
+    assert any(c["id"] == curriculum_id for c in currs)
 
-        ps, ptotal = await papers.get_paper_by_curr(curriculum_id=curriculum_id, page=1, limit=50)
-        assert ptotal >= 1
-        assert any(p["id"] == paper_id for p in ps)
-    finally:
-        await curriculums.delete_curriculum(curriculum_id)
-        await papers.delete_paper(paper_id)
+    ps, ptotal = await papers.get_paper_by_curr(curriculum_id=curriculum_id, page=1, limit=50)
+    assert ptotal >= 1
+    assert any(p["id"] == paper_id for p in ps)
 
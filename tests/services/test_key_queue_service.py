@@ -1,15 +1,47 @@
 import asyncio
 import time
+from collections.abc import Awaitable, Callable
 
 import pytest
 
 from app.services.key_queue_service import KeyQueueService
 
 
-@pytest.mark.asyncio
-async def test_fifo_and_round_robin_assignment() -> None:
-    service = KeyQueueService(total_keys=2, cooldown_seconds=0)
+class _FakeClock:
+    """Manually advanced monotonic clock for KeyQueueService."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _wait_for_waiting_jobs(service: KeyQueueService, count: int) -> None:
+    """Yield to the loop until exactly `count` jobs are queued (no fixed sleeps)."""
+
+    async def _poll() -> None:
+        while service.waiting_jobs_count() != count:
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(_poll(), timeout=1.0)
+
+
+@pytest.fixture
+def fake_clock() -> _FakeClock:
+    return _FakeClock()
 
+
+@pytest.fixture
+def queue_service(request: pytest.FixtureRequest, fake_clock: _FakeClock) -> KeyQueueService:
+    """KeyQueueService built from indirect params, driven by `fake_clock`."""
+
+    return KeyQueueService(clock=fake_clock, **request.param)
+
+
+async def _fifo_and_round_robin_assignment(
+    service: KeyQueueService, clock: _FakeClock
+) -> None:
     first_slot = await service.acquire_slot(task_type="test", task_id="job-1")
     second_slot = await service.acquire_slot(task_type="test", task_id="job-2")
     assert first_slot == 1
@@ -25,9 +57,9 @@ async def test_fifo_and_round_robin_assignment() -> None:
     task_3 = asyncio.create_task(wait_for_slot("job-3"))
     task_4 = asyncio.create_task(wait_for_slot("job-4"))
 
-    await asyncio.sleep(0.05)
+    await _wait_for_waiting_jobs(service, 2)
     await service.release_slot(first_slot)
-    await asyncio.sleep(0.05)
+    await _wait_for_waiting_jobs(service, 1)
     await service.release_slot(second_slot)
 
     await asyncio.wait_for(asyncio.gather(task_3, task_4), timeout=1.0)
@@ -35,25 +67,26 @@ async def test_fifo_and_round_robin_assignment() -> None:
     assert results == [("job-3", 1), ("job-4", 2)]
 
 
-@pytest.mark.asyncio
-async def test_cooldown_blocks_reassignment() -> None:
-    service = KeyQueueService(total_keys=1, cooldown_seconds=1)
-
+async def _cooldown_blocks_reassignment(service: KeyQueueService, clock: _FakeClock) -> None:
     slot = await service.acquire_slot(task_type="test", task_id="job-1")
     await service.release_slot(slot)
 
-    started_at = time.monotonic()
-    reassigned_slot = await service.acquire_slot(task_type="test", task_id="job-2")
-    elapsed = time.monotonic() - started_at
+    clock.now += 0.9
+    snapshot = await service.get_snapshot()
+    assert snapshot["available_keys"] == 0
+    assert snapshot["cooldown_keys"] == 1
+
+    clock.now += 0.2
+    reassigned_slot = await asyncio.wait_for(
+        service.acquire_slot(task_type="test", task_id="job-2"), timeout=0.5
+    )
 
     assert reassigned_slot == 1
-    assert elapsed >= 0.9
 
 
-@pytest.mark.asyncio
-async def test_release_curriculum_slot_by_lease() -> None:
-    service = KeyQueueService(total_keys=1, cooldown_seconds=0)
-
+async def _release_curriculum_slot_by_lease(
+    service: KeyQueueService, clock: _FakeClock
+) -> None:
     slot = await service.acquire_slot(
         task_type="curriculum_generation",
         task_id="curr-1",
@@ -68,12 +101,44 @@ async def test_release_curriculum_slot_by_lease() -> None:
     assert next_slot == 1
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("queue_service", "scenario"),
+    [
+        pytest.param(
+            {"total_keys": 2, "cooldown_seconds": 0},
+            _fifo_and_round_robin_assignment,
+            id="fifo_and_round_robin_assignment",
+        ),
+        pytest.param(
+            {"total_keys": 1, "cooldown_seconds": 1},
+            _cooldown_blocks_reassignment,
+            id="cooldown_blocks_reassignment",
+        ),
+        pytest.param(
+            {"total_keys": 1, "cooldown_seconds": 0},
+            _release_curriculum_slot_by_lease,
+            id="release_curriculum_slot_by_lease",
+        ),
+    ],
+    indirect=["queue_service"],
+)
+async def test_slot_assignment_scenarios(
+    queue_service: KeyQueueService,
+    fake_clock: _FakeClock,
+    scenario: Callable[[KeyQueueService, _FakeClock], Awaitable[None]],
+) -> None:
+    await scenario(queue_service, fake_clock)
+
+
 @pytest.mark.asyncio
 async def test_curriculum_task_uses_task_specific_cooldown() -> None:
+    clock = _FakeClock()
     service = KeyQueueService(
         total_keys=1,
         cooldown_seconds=0,
         cooldown_by_task={"curriculum_generation": 1},
+        clock=clock,
     )
 
     slot = await service.acquire_slot(
@@ -82,12 +147,16 @@ async def test_curriculum_task_uses_task_specific_cooldown() -> None:
     )
     await service.release_slot(slot)
 
-    started_at = time.monotonic()
-    reassigned_slot = await service.acquire_slot(task_type="test", task_id="job-2")
-    elapsed = time.monotonic() - started_at
+    clock.now += 0.9
+    snapshot = await service.get_snapshot()
+    assert snapshot["cooldown_keys"] == 1
+
+    clock.now += 0.2
+    reassigned_slot = await asyncio.wait_for(
+        service.acquire_slot(task_type="test", task_id="job-2"), timeout=0.5
+    )
 
     assert reassigned_slot == 1
-    assert elapsed >= 0.9
 
 
 @pytest.mark.asyncio
@@ -118,14 +187,15 @@ async def test_cancelled_waiting_task_removed_from_queue() -> None:
     waiting_task = asyncio.create_task(
         service.acquire_slot(task_type="test", task_id="job-2")
     )
-    await asyncio.sleep(0.05)
+    # One scheduler tick lets the task enqueue itself and block on the condition
+    await asyncio.sleep(0)
+    assert service.waiting_jobs_count() == 1
     waiting_task.cancel()
 
     with pytest.raises(asyncio.CancelledError):
         await waiting_task
 
-    snapshot = await service.get_snapshot()
-    assert snapshot["waiting_jobs"] == 0
+    assert service.waiting_jobs_count() == 0
 
     await service.release_slot(slot)
 
@@ -139,7 +209,7 @@ async def test_snapshot_includes_my_position() -> None:
         service.acquire_slot(task_type="test", task_id="job-2")
     )
 
-    await asyncio.sleep(0.05)
+    await _wait_for_waiting_jobs(service, 1)
     snapshot = await service.get_snapshot(task_id="job-2", task_type="test")
     assert snapshot["my_status"] == "waiting"
     assert snapshot["my_position"] == 1
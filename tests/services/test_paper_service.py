@@ -0,0 +1,437 @@
+"""Paper Service Tests (crud/pdf_service는 가짜 구현으로 대체)."""
+
+import asyncio
+import hashlib
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+
+from app import crud
+from app.core.config import settings
+from app.crud.errors import ConflictError
+from app.services import paper_service, pdf_service
+from app.services.key_queue_service import KeyQueueService
+
+_SHA = "a" * 64
+
+_PARSED = {
+    "title": "Attention Is All You Need",
+    "author": ["Ashish Vaswani"],
+    "abstract": "The dominant sequence transduction models.",
+    "body": [{"subtitle": "1 Introduction", "text": "Recurrent neural networks."}],
+}
+
+
+class _FakeBackend:
+    """process_pdf_upload가 호출하는 crud/GROBID/Storage 함수의 가짜 구현
+
+    `by_sha256`은 get_paper_by_sha256 호출마다 순서대로 반환할 값이고,
+    각 호출은 `calls`에 이름별로 기록됩니다.
+    """
+
+    def __init__(self) -> None:
+        self.by_sha256: list[dict[str, Any] | None] = [None]
+        self.by_title: dict[str, Any] | None = None
+        self.extract_error: Exception | None = None
+        self.create_error: Exception | None = None
+        self.calls: dict[str, list[dict[str, Any]]] = {}
+
+    def _record(self, func: str, /, **kwargs: Any) -> None:
+        self.calls.setdefault(func, []).append(kwargs)
+
+    def count(self, func: str) -> int:
+        return len(self.calls.get(func, []))
+
+    async def ensure_user_exists(self, **kwargs: Any) -> None:
+        self._record("ensure_user_exists", **kwargs)
+
+    async def get_paper_by_sha256(self, content_sha256: str) -> dict[str, Any] | None:
+        self._record("get_paper_by_sha256", content_sha256=content_sha256)
+        return self.by_sha256.pop(0) if len(self.by_sha256) > 1 else self.by_sha256[0]
+
+    async def get_paper_by_title(self, title: str) -> dict[str, Any] | None:
+        self._record("get_paper_by_title", title=title)
+        return self.by_title
+
+    async def update_paper(self, paper_id: str, **fields: Any) -> dict[str, Any]:
+        self._record("update_paper", paper_id=paper_id, **fields)
+        return {"id": paper_id, "content_sha256": _SHA, **fields}
+
+    async def ensure_user_paper(self, *, user_id: str, paper_id: str) -> None:
+        self._record("ensure_user_paper", user_id=user_id, paper_id=paper_id)
+
+    async def create_curriculum_for_paper(self, **kwargs: Any) -> dict[str, Any]:
+        self._record("create_curriculum_for_paper", **kwargs)
+        return {"id": "curriculum-reused"}
+
+    async def extract_header_only(self, contents: bytes) -> dict[str, Any]:
+        self._record("extract_header_only")
+        return {"title": _PARSED["title"], "authors": _PARSED["author"], "abstract": "", "keywords": []}
+
+    async def extract_all(self, contents: bytes) -> tuple[dict[str, Any], dict[str, Any]]:
+        self._record("extract_all")
+        if self.extract_error is not None:
+            raise self.extract_error
+        metadata = {
+            "title": _PARSED["title"],
+            "authors": _PARSED["author"],
+            "abstract": _PARSED["abstract"],
+            "keywords": [],
+        }
+        return metadata, _PARSED
+
+    async def upload_pdf_to_storage(self, **kwargs: Any) -> tuple[str, str]:
+        self._record("upload_pdf_to_storage", **kwargs)
+        return f"user-1/{_SHA}.pdf", "https://storage.example/papers/user-1.pdf"
+
+    async def create_paper_with_curriculum(self, **kwargs: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+        self._record("create_paper_with_curriculum", **kwargs)
+        if self.create_error is not None:
+            raise self.create_error
+        return {"id": "paper-new", **kwargs}, {"id": "curriculum-new"}
+
+
+@pytest.fixture
+def backend(monkeypatch: pytest.MonkeyPatch) -> _FakeBackend:
+    fake = _FakeBackend()
+    monkeypatch.setattr(paper_service, "ensure_user_exists", fake.ensure_user_exists)
+    monkeypatch.setattr(crud.papers, "get_paper_by_sha256", fake.get_paper_by_sha256)
+    monkeypatch.setattr(crud.papers, "get_paper_by_title", fake.get_paper_by_title)
+    monkeypatch.setattr(crud.papers, "update_paper", fake.update_paper)
+    monkeypatch.setattr(crud.junctions, "ensure_user_paper", fake.ensure_user_paper)
+    monkeypatch.setattr(paper_service, "create_curriculum_for_paper", fake.create_curriculum_for_paper)
+    monkeypatch.setattr(pdf_service, "extract_header_only", fake.extract_header_only)
+    monkeypatch.setattr(pdf_service, "extract_all", fake.extract_all)
+    monkeypatch.setattr(paper_service, "upload_pdf_to_storage", fake.upload_pdf_to_storage)
+    monkeypatch.setattr(paper_service, "create_paper_with_curriculum", fake.create_paper_with_curriculum)
+    # 키워드 추출 API는 설정되지 않은 것으로 간주 (백그라운드 태스크 생성 안 함)
+    monkeypatch.setattr(paper_service, "_KEYWORD_API_URL", None)
+    return fake
+
+
+async def _upload(**overrides: Any) -> tuple[dict[str, Any], dict[str, Any], str]:
+    kwargs: dict[str, Any] = {
+        "contents": b"%PDF-1.7 test",
+        "filename": "attention.pdf",
+        "user_id": "user-1",
+        "user_email": "user@example.com",
+        "user_name": "User",
+        "user_avatar_url": None,
+        "user_role": "user",
+        "content_sha256": _SHA,
+    }
+    kwargs.update(overrides)
+    return await paper_service.process_pdf_upload(**kwargs)
+
+
+async def test_hash_hit_without_extracted_text_retries_grobid(backend: _FakeBackend) -> None:
+    """이전 GROBID 실패로 extracted_text가 없는 paper는 다시 추출해 같은 row를 갱신한다."""
+    backend.by_sha256 = [
+        {"id": "paper-failed", "title": "attention", "extracted_text": None, "keywords": None}
+    ]
+
+    paper, curriculum, _ = await _upload()
+
+    assert backend.count("extract_all") == 1
+    (update,) = backend.calls["update_paper"]
+    assert update["paper_id"] == "paper-failed"
+    assert update["extracted_text"] == _PARSED
+    assert update["title"] == _PARSED["title"]
+    assert paper["id"] == "paper-failed"
+    assert curriculum["id"] == "curriculum-reused"
+    assert backend.count("create_paper_with_curriculum") == 0
+    assert backend.count("upload_pdf_to_storage") == 0
+
+
+async def test_hash_hit_retry_failure_still_reuses_row(backend: _FakeBackend) -> None:
+    """재추출도 실패하면 row를 갱신하지 않고 그대로 재사용한다 (unique 인덱스와 충돌하지 않음)."""
+    backend.by_sha256 = [{"id": "paper-failed", "title": "attention", "extracted_text": None}]
+    backend.extract_error = ValueError("GROBID down")
+
+    paper, _, _ = await _upload()
+
+    assert backend.count("extract_all") == 1
+    assert backend.count("update_paper") == 0
+    assert backend.count("create_paper_with_curriculum") == 0
+    assert paper["id"] == "paper-failed"
+
+
+async def test_concurrent_upload_conflict_reuses_winner(backend: _FakeBackend) -> None:
+    """같은 PDF의 동시 업로드로 unique 위반이 나면 먼저 생성된 paper를 재사용한다."""
+    winner = {"id": "paper-winner", "title": "Winner Title", "extracted_text": _PARSED}
+    backend.by_sha256 = [None, winner]
+    backend.create_error = ConflictError("duplicate content_sha256")
+
+    paper, curriculum, _ = await _upload()
+
+    assert backend.count("create_paper_with_curriculum") == 1
+    assert backend.count("get_paper_by_sha256") == 2
+    assert paper is winner
+    assert curriculum["id"] == "curriculum-reused"
+    (link,) = backend.calls["ensure_user_paper"]
+    assert link == {"user_id": "user-1", "paper_id": "paper-winner"}
+
+
+async def test_conflict_without_winner_is_raised(backend: _FakeBackend) -> None:
+    """충돌 후에도 같은 해시의 paper가 없으면 원래 오류를 그대로 올린다."""
+    backend.create_error = ConflictError("duplicate")
+
+    with pytest.raises(ConflictError):
+        await _upload()
+
+
+# ---------------------------------------------------------------------------
+# 해시 캐시 분기 + 백그라운드 키워드 추출
+# ---------------------------------------------------------------------------
+
+_KEYWORD_URL = "http://keywords.test/api/curr/keywords/extract"
+
+
+@pytest.fixture
+def keyword_jobs(monkeypatch: pytest.MonkeyPatch, backend: _FakeBackend) -> list[dict[str, Any]]:
+    """키워드 API가 설정된 상태에서 예약된 _run_keyword_extraction 호출 인자 목록"""
+    jobs: list[dict[str, Any]] = []
+
+    async def fake_run_keyword_extraction(**kwargs: Any) -> None:
+        jobs.append(kwargs)
+
+    monkeypatch.setattr(paper_service, "_KEYWORD_API_URL", _KEYWORD_URL)
+    monkeypatch.setattr(paper_service, "_KEYWORD_HEADERS", {"Authorization": "Bearer test"})
+    monkeypatch.setattr(paper_service, "_run_keyword_extraction", fake_run_keyword_extraction)
+    return jobs
+
+
+async def test_hash_full_hit_skips_grobid_upload_and_keywords(
+    backend: _FakeBackend, keyword_jobs: list[dict[str, Any]]
+) -> None:
+    """키워드 5개가 채워진 해시 일치 paper는 GROBID/업로드/키워드 추출 없이 재사용한다."""
+    cached = {
+        "id": "paper-cached",
+        "title": "Cached Title",
+        "extracted_text": _PARSED,
+        "keywords": ["a", "b", "c", "d", "e"],
+        "pdf_storage_path": "user-0/cached.pdf",
+    }
+    backend.by_sha256 = [cached]
+
+    paper, _, pdf_url = await _upload()
+    await paper_service.drain_background_tasks()
+
+    assert paper is cached
+    assert pdf_url.endswith("user-0/cached.pdf")
+    for func in ("extract_header_only", "extract_all", "upload_pdf_to_storage", "create_paper_with_curriculum"):
+        assert backend.count(func) == 0
+    assert keyword_jobs == []
+
+
+async def test_hash_partial_hit_reuses_text_and_reextracts_keywords(
+    backend: _FakeBackend, keyword_jobs: list[dict[str, Any]]
+) -> None:
+    """키워드가 5개 미만인 해시 일치 paper는 저장된 본문으로 키워드 추출만 다시 예약한다."""
+    backend.by_sha256 = [
+        {
+            "id": "paper-partial",
+            "title": "Partial Title",
+            "authors": ["A"],
+            "abstract": "abstract",
+            "extracted_text": _PARSED,
+            "keywords": ["a", "b"],
+        }
+    ]
+
+    paper, _, _ = await _upload(queue_task_id="queue-1")
+    await paper_service.drain_background_tasks()
+
+    assert paper["id"] == "paper-partial"
+    assert backend.count("extract_header_only") == 0
+    assert backend.count("extract_all") == 0
+    assert backend.count("upload_pdf_to_storage") == 0
+    (job,) = keyword_jobs
+    assert job["paper_id"] == "paper-partial"
+    assert job["paper_title"] == "Partial Title"
+    assert job["extracted_text"] == _PARSED
+    assert job["queue_task_id"] == "queue-1"
+
+
+async def test_hash_miss_extracts_uploads_creates_and_schedules_keywords(
+    backend: _FakeBackend, keyword_jobs: list[dict[str, Any]]
+) -> None:
+    """해시/제목 캐시 미스면 본문 추출, Storage 업로드, paper 생성 후 키워드 추출을 예약한다."""
+    paper, curriculum, pdf_url = await _upload()
+    await paper_service.drain_background_tasks()
+
+    assert backend.count("extract_header_only") == 1
+    assert backend.count("extract_all") == 1
+    (upload,) = backend.calls["upload_pdf_to_storage"]
+    assert upload["content_sha256"] == _SHA
+    (created,) = backend.calls["create_paper_with_curriculum"]
+    assert created["title"] == _PARSED["title"]
+    assert created["extracted_text"] == _PARSED
+    assert created["content_sha256"] == _SHA
+    assert paper["id"] == "paper-new"
+    assert curriculum["id"] == "curriculum-new"
+    assert pdf_url == "https://storage.example/papers/user-1.pdf"
+    (job,) = keyword_jobs
+    assert job["paper_id"] == "paper-new"
+
+
+async def test_run_keyword_extraction_updates_paper_and_releases_slot(
+    monkeypatch: pytest.MonkeyPatch, backend: _FakeBackend
+) -> None:
+    """키워드 API 응답으로 paper의 keywords/summary를 갱신하고 키 슬롯을 반납한다."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"keywords": ["attention"], "summary": "short"})
+
+    queue = KeyQueueService(total_keys=1, cooldown_seconds=0)
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(paper_service, "_KEYWORD_API_URL", _KEYWORD_URL)
+    monkeypatch.setattr(paper_service, "key_queue_service", queue)
+    monkeypatch.setattr(paper_service, "get_http_client", lambda: http_client)
+
+    async with http_client:
+        await paper_service._run_keyword_extraction(
+            paper_id="paper-1",
+            paper_title="Title",
+            paper_authors=["A", "B"],
+            paper_abstract="abstract",
+            extracted_text=orjson.dumps(_PARSED).decode(),
+            queue_task_id=None,
+        )
+
+    (request,) = requests
+    body = orjson.loads(request.content)
+    assert body["paper_id"] == "paper-1"
+    assert body["paper_content"]["author"] == "A, B"
+    assert body["paper_content"]["body"] == _PARSED["body"]
+    (update,) = backend.calls["update_paper"]
+    assert update == {"paper_id": "paper-1", "keywords": ["attention"], "summary": "short"}
+    snapshot = await queue.get_snapshot()
+    assert snapshot["busy_keys"] == 0
+
+
+async def test_drain_background_tasks_cancels_after_timeout() -> None:
+    """종료 시 timeout 안에 끝난 태스크는 기다리고, 남은 태스크는 취소한다."""
+    finished = asyncio.Event()
+
+    async def quick() -> None:
+        finished.set()
+
+    async def stuck() -> None:
+        await asyncio.Event().wait()
+
+    quick_task = asyncio.create_task(quick())
+    stuck_task = asyncio.create_task(stuck())
+    for task in (quick_task, stuck_task):
+        paper_service._background_tasks.add(task)
+        task.add_done_callback(paper_service._background_tasks.discard)
+
+    await paper_service.drain_background_tasks(timeout=0.01)
+
+    assert finished.is_set()
+    assert stuck_task.cancelled()
+    assert not paper_service._background_tasks
+
+
+# ---------------------------------------------------------------------------
+# 링크 제출: arXiv URL 파싱 + PDF 스트리밍 다운로드
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://arxiv.org/pdf/1706.03762", "1706.03762"),
+        ("https://arxiv.org/pdf/1706.03762.pdf", "1706.03762"),
+        ("https://arxiv.org/pdf/1706.03762v5", "1706.03762v5"),
+        ("http://arxiv.org/pdf/1706.03762v5.pdf", "1706.03762v5"),
+        ("HTTPS://ARXIV.ORG/PDF/1706.03762.PDF", "1706.03762"),
+        ("https://arxiv.org/abs/1706.03762", None),
+        ("https://arxiv.org/abs/1706.03762v5", None),
+        ("https://arxiv.org/pdf/", None),
+        ("https://arxiv.org/pdf/1706.03762?download=1", None),
+        ("https://example.com/pdf/1706.03762", None),
+    ],
+)
+def test_parse_arxiv_pdf(url: str, expected: str | None) -> None:
+    assert paper_service._parse_arxiv_pdf(url) == expected
+
+
+def _serve(
+    monkeypatch: pytest.MonkeyPatch,
+    *,
+    content: bytes,
+    content_type: str | None = "application/pdf",
+    status_code: int = 200,
+) -> httpx.AsyncClient:
+    """모든 요청에 같은 응답을 돌려주는 MockTransport 클라이언트를 공유 클라이언트로 설치"""
+    headers = {"content-type": content_type} if content_type else {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, content=content, headers=headers)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(paper_service, "get_http_client", lambda: client)
+    return client
+
+
+async def test_download_pdf_hashes_streamed_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """여러 청크로 받은 본문을 그대로 이어 붙이고, 스트리밍 중 계산한 해시가 전체 해시와 같다."""
+    pdf = b"%PDF-1.7\n" + bytes(range(256)) * 1024  # 청크 크기(64KB)보다 큰 본문
+    _serve(monkeypatch, content=pdf)
+
+    contents, filename, digest = await paper_service._download_pdf_from_url(
+        "https://arxiv.org/pdf/1706.03762v5"
+    )
+
+    assert contents == pdf
+    assert filename == "1706.03762v5.pdf"
+    assert digest == hashlib.sha256(pdf).hexdigest()
+
+
+async def test_download_pdf_uses_path_filename(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, content=b"%PDF-1.7", content_type=None)
+
+    _, filename, _ = await paper_service._download_pdf_from_url("https://example.com/files/paper.pdf")
+
+    assert filename == "paper.pdf"
+
+
+async def test_download_pdf_rejects_oversize(monkeypatch: pytest.MonkeyPatch) -> None:
+    """최대 업로드 크기를 넘는 본문은 스트리밍 도중 거절한다."""
+    monkeypatch.setattr(settings, "MAX_UPLOAD_SIZE_MB", 1)
+    _serve(monkeypatch, content=b"0" * (1024 * 1024 + 1))
+
+    with pytest.raises(ValueError, match="파일 크기"):
+        await paper_service._download_pdf_from_url("https://example.com/big.pdf")
+
+
+@pytest.mark.parametrize(
+    ("url", "content_type"),
+    [
+        # arXiv 링크인데 HTML이 오는 경우
+        ("https://arxiv.org/pdf/1706.03762", "text/html; charset=utf-8"),
+        # 경로는 .pdf지만 서버가 다른 형식을 돌려주는 경우
+        ("https://example.com/paper.pdf", "text/html"),
+        # 경로도 Content-Type도 PDF가 아닌 경우
+        ("https://example.com/paper", "text/html"),
+    ],
+)
+async def test_download_pdf_rejects_non_pdf(
+    monkeypatch: pytest.MonkeyPatch, url: str, content_type: str
+) -> None:
+    _serve(monkeypatch, content=b"<html></html>", content_type=content_type)
+
+    with pytest.raises(ValueError):
+        await paper_service._download_pdf_from_url(url)
+
+
+async def test_download_pdf_http_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    _serve(monkeypatch, content=b"", status_code=404)
+
+    with pytest.raises(ValueError, match="HTTP 404"):
+        await paper_service._download_pdf_from_url("https://example.com/missing.pdf")
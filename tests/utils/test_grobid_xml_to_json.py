@@ -0,0 +1,83 @@
+from pathlib import Path
+
+import orjson
+import pytest
+from lxml import etree as ET
+
+from app.utils import (
+    convert_grobid_xml_to_json,
+    parse_grobid_xml,
+    parse_grobid_xml_string,
+)
+from app.utils.grobid_xml_to_json import extract_text, tei
+
+_SAMPLE = Path(__file__).parent / "fixtures" / "sample.tei.xml"
+
+_EXPECTED = {
+    # Long lightweight-header title is trimmed to its last sentence
+    "title": "Attention Is All You Need For Everything",
+    "author": [
+        "Ashish Vaswani∗ Google Brain avaswani@google.com",
+        "Noam M Shazeer∗ Google Research",
+        "Nobody",
+    ],
+    # Paragraphs from the first footnote ("* Equal contribution.") on are dropped
+    "abstract": (
+        "The dominant sequence [1] transduction models are based on complex"
+        " recurrent networks. We propose the Transformer."
+    ),
+    "body": [
+        {
+            "subtitle": "1 Introduction",
+            "text": (
+                "Recurrent neural networks, long short-term memory and gated recurrent [13]"
+                " neural networks. Second paragraph here with enough text."
+            ),
+        },
+        {"subtitle": "1.1 Sub", "text": "Nested paragraph text that is long enough."},
+        {"subtitle": "Deep", "text": "Deepest."},
+        # "Figure3 stuff" and "Attention Visualizations" are skipped with their subtrees
+        {"subtitle": "", "text": "No head paragraph that is fairly long. Tail ref text"},
+        # Inline markup in heads is joined with spaces, so these are not invalid heads
+        {
+            "subtitle": "2 Figure 3 Ablations",
+            "text": "Inline refs inside a head must not glue into an invalid pattern.",
+        },
+        {
+            "subtitle": "Layer 5 Probing",
+            "text": "Separate inline children keep their separating space.",
+        },
+        {"subtitle": "3 Model Architecture", "text": ""},
+    ],
+}
+
+
+def test_parse_grobid_xml_string_matches_expected() -> None:
+    xml_bytes = _SAMPLE.read_bytes()
+
+    assert parse_grobid_xml_string(xml_bytes) == _EXPECTED
+    assert parse_grobid_xml_string(xml_bytes.decode("utf-8")) == _EXPECTED
+
+
+def test_convert_grobid_xml_to_json_writes_same_result(tmp_path: Path) -> None:
+    assert parse_grobid_xml(_SAMPLE) == _EXPECTED
+
+    out_path = tmp_path / "sample.json"
+    assert convert_grobid_xml_to_json(_SAMPLE, out_path) == _EXPECTED
+    assert orjson.loads(out_path.read_bytes()) == _EXPECTED
+
+
+def test_parse_grobid_xml_string_without_header_raises() -> None:
+    with pytest.raises(ValueError):
+        parse_grobid_xml_string('<TEI xmlns="http://www.tei-c.org/ns/1.0"><text/></TEI>')
+
+
+def test_extract_text_skip_tags_keeps_tail() -> None:
+    p = ET.fromstring(
+        '<p xmlns="http://www.tei-c.org/ns/1.0">Loss <formula>x<sup>2</sup></formula>'
+        " is minimised <ref>[3]</ref>.</p>"
+    )
+
+    assert extract_text(p) == "Loss x 2 is minimised [3] ."
+    assert extract_text(p, skip_tags={tei("formula")}) == "Loss is minimised [3] ."
+    assert extract_text(None) == ""